@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AiAgentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ai_agent'
+
+    def ready(self):
+        # Connect the batched post-commit recommendation dispatch
+        from . import signals  # noqa: F401
@@ -0,0 +1,171 @@
+"""
+AI Agent - Batched Anomaly Processing Service
+Turns detected AnomalyEvents into AgentRecommendations in batches.
+
+Processing anomalies one-by-one pays the fixed costs (queryset setup,
+recommendation generation, INSERT round-trip) per row. This service drains
+all pending anomalies in a single query and writes all recommendations with
+one bulk_create, so the fixed costs are amortized across the whole batch.
+"""
+
+from typing import Dict, List, Tuple
+
+from crop_app.models import AnomalyEvent, AgentRecommendation
+
+
+# Recommended action + explanation per (anomaly type prefix, severity).
+# Confidence reflects how specific the playbook entry is.
+_PLAYBOOK: Dict[Tuple[str, str], Tuple[str, str, float]] = {
+    ('moisture', 'high'): (
+        'Inspect irrigation system immediately',
+        'Soil moisture shows a severe anomaly. A rapid drop usually means '
+        'an irrigation failure (blocked line, pump fault); a spike can mean '
+        'a stuck valve. Check the irrigation hardware for this plot.',
+        0.9,
+    ),
+    ('moisture', 'medium'): (
+        'Schedule irrigation check within 24h',
+        'Soil moisture is drifting outside the expected range. Verify the '
+        'irrigation schedule and sensor placement for this plot.',
+        0.75,
+    ),
+    ('moisture', 'low'): (
+        'Monitor soil moisture trend',
+        'A mild moisture anomaly was detected. No immediate action needed; '
+        'keep watching the trend over the next cycles.',
+        0.6,
+    ),
+    ('temperature', 'high'): (
+        'Check for heat stress and sensor placement',
+        'Temperature readings are far outside the normal diurnal cycle. '
+        'Verify greenhouse ventilation/shading and that the sensor is not '
+        'exposed to direct interference.',
+        0.85,
+    ),
+    ('temperature', 'medium'): (
+        'Review temperature readings for calibration drift',
+        'Temperature is deviating from the expected daily pattern. This is '
+        'often calibration drift - compare against a reference sensor.',
+        0.7,
+    ),
+    ('temperature', 'low'): (
+        'Monitor temperature trend',
+        'A mild temperature anomaly was detected. Keep monitoring; no '
+        'intervention required yet.',
+        0.6,
+    ),
+    ('humidity', 'high'): (
+        'Inspect humidity sensor and ventilation',
+        'Humidity readings are severely anomalous. Check the sensor for '
+        'condensation or malfunction and verify ventilation.',
+        0.85,
+    ),
+    ('humidity', 'medium'): (
+        'Cross-check humidity against temperature correlation',
+        'Humidity is deviating from its usual inverse correlation with '
+        'temperature. Possible sensor drift - compare with nearby plots.',
+        0.7,
+    ),
+    ('humidity', 'low'): (
+        'Monitor humidity trend',
+        'A mild humidity anomaly was detected. Keep monitoring; no '
+        'intervention required yet.',
+        0.6,
+    ),
+}
+
+_DEFAULT_ENTRY = (
+    'Review anomaly manually',
+    'No playbook entry matched this anomaly type; a manual review of the '
+    'sensor data for this plot is recommended.',
+    0.5,
+)
+
+
+class AgentService:
+    """
+    Batched agent that converts pending anomalies into recommendations.
+    """
+
+    def get_pending_anomalies(self):
+        """
+        Anomalies that have no recommendation yet.
+
+        Returns:
+            QuerySet of AnomalyEvent (unevaluated)
+        """
+        return AnomalyEvent.objects.filter(recommendation__isnull=True)
+
+    def build_recommendation(self, anomaly: AnomalyEvent) -> AgentRecommendation:
+        """
+        Build (but do not save) the recommendation for one anomaly.
+        """
+        sensor_kind = anomaly.anomaly_type.split('_')[0]
+        action, explanation, confidence = _PLAYBOOK.get(
+            (sensor_kind, anomaly.severity), _DEFAULT_ENTRY
+        )
+        return AgentRecommendation(
+            anomaly_event=anomaly,
+            recommended_action=action,
+            explanation_text=explanation,
+            # Scale playbook confidence by how sure the model was
+            confidence=round(confidence * anomaly.model_confidence, 4),
+        )
+
+    def process_pending_anomalies(self, batch_size: int = 500,
+                                  pending: List[AnomalyEvent] = None) -> List[AgentRecommendation]:
+        """
+        Drain all pending anomalies in one pass.
+
+        One SELECT fetches the batch (with its related rows), the
+        recommendations are generated in memory, and a single bulk_create
+        writes them - instead of one SELECT + INSERT per anomaly.
+
+        Args:
+            batch_size: Rows per INSERT in the bulk_create
+            pending: Already-materialized anomalies to process; pass this
+                when the caller has fetched the batch itself so the same
+                rows are not selected twice
+
+        Returns:
+            List of created AgentRecommendation instances
+        """
+        if pending is None:
+            # iterator() streams the backlog through a server-side
+            # cursor in chunks instead of materializing the whole
+            # queryset (and its result cache) before processing - peak
+            # memory stays flat however large the backlog grows
+            pending = self.get_pending_anomalies().select_related(
+                'plot', 'sensor_reading'
+            ).iterator(chunk_size=batch_size)
+
+        recommendations = [self.build_recommendation(a) for a in pending]
+        if not recommendations:
+            return []
+        return AgentRecommendation.objects.bulk_create(
+            recommendations, batch_size=batch_size
+        )
+
+    def process_pks(self, pks: List[int]) -> List[AgentRecommendation]:
+        """
+        Process a known set of anomalies by pk (used by the post-commit
+        signal batch): one SELECT for the whole set, one bulk_create.
+        """
+        pending = list(
+            AnomalyEvent.objects.filter(
+                pk__in=pks, recommendation__isnull=True
+            ).select_related('plot', 'sensor_reading')
+        )
+        return self.process_pending_anomalies(pending=pending)
+
+
+# Module-level singleton so callers share one service instance
+_agent_service = None
+
+
+def get_agent_service() -> AgentService:
+    """Get the shared AgentService instance."""
+    global _agent_service
+    if _agent_service is None:
+        _agent_service = AgentService()
+    return _agent_service
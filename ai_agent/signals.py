@@ -0,0 +1,54 @@
+"""
+Batched post-commit recommendation dispatch.
+
+A per-row post_save handler would pay the full agent pass (queryset
+setup, playbook lookup, INSERT) once per AnomalyEvent, synchronously,
+inside the caller's transaction. Instead, saves only queue the event's
+pk on a thread-local list and a transaction.on_commit hook drains the
+whole list in a single batched service call after the transaction lands
+(the first hook to run takes everything; later ones find it empty).
+Creating N anomalies in one atomic block costs one agent pass, not N.
+
+bulk_create does not fire post_save, so bulk ingestion paths keep
+dispatching the service explicitly.
+"""
+
+import threading
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from crop_app.models import AnomalyEvent
+
+from .services import get_agent_service
+
+_pending = threading.local()
+
+
+def _drain():
+    """Process every anomaly queued in this transaction in one pass."""
+    pks = _pending.pks
+    _pending.pks = []
+    if pks:
+        get_agent_service().process_pks(pks)
+
+
+@receiver(post_save, sender=AnomalyEvent, dispatch_uid='ai_agent_queue_anomaly')
+def queue_anomaly(sender, instance, created, **kwargs):
+    """Queue a new anomaly; the batch runs once after commit."""
+    if not created:
+        return
+
+    pks = getattr(_pending, 'pks', None)
+    if pks is None:
+        pks = _pending.pks = []
+    pks.append(instance.pk)
+    # Registered on every save, not just when the list is empty: a
+    # rollback discards the hook but not the queued pks, and gating on
+    # emptiness would leave every later transaction on this thread
+    # hookless. _drain empties the list on its first run, so the extra
+    # registrations are no-ops, and process_pks filters out pks left
+    # over from rolled-back rows. Outside atomic blocks on_commit runs
+    # immediately, preserving the old synchronous behavior.
+    transaction.on_commit(_drain)
@@ -0,0 +1,93 @@
+"""
+UDP ingestion listener for the simulator's binary transport.
+
+Receives one datagram per plot per cycle, packed as <ifffQ
+(plot_id, temperature, humidity, moisture, timestamp_ns), and inserts
+the three readings into the same SensorReading table the HTTP endpoint
+feeds. The wire timestamp becomes the rows' capture time; a zero falls
+back to the model's now() default.
+Usage: python manage.py udp_ingest [--port 9999]
+"""
+
+import socket
+import struct
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError
+
+from crop_app.models import FieldPlot, SensorReading
+
+_STRUCT = struct.Struct('<ifffQ')
+_SENSOR_FIELDS = ('temperature', 'humidity', 'moisture')
+
+
+class Command(BaseCommand):
+    help = 'Listen for binary sensor datagrams and insert readings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', type=str, default='0.0.0.0')
+        parser.add_argument('--port', type=int, default=9999)
+
+    def handle(self, *args, **options):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind((options['host'], options['port']))
+        self.stdout.write(
+            f"📡 UDP ingest listening on {options['host']}:{options['port']}"
+        )
+
+        # Owner resolved once per plot and cached - datagrams only carry
+        # the plot id, and the denormalized owner column must be filled
+        # the same way the model's save() does it
+        owner_cache = {}
+
+        while True:
+            data, _addr = sock.recvfrom(_STRUCT.size)
+            if len(data) != _STRUCT.size:
+                continue
+            plot_id, temperature, humidity, moisture, ts_ns = (
+                _STRUCT.unpack(data)
+            )
+
+            owner_id = owner_cache.get(plot_id)
+            if owner_id is None:
+                owner_id = (
+                    FieldPlot.objects.filter(pk=plot_id)
+                    .values_list('farm__owner_id', flat=True)
+                    .first()
+                )
+                if owner_id is None:
+                    # Unknown plot: drop the datagram without caching the
+                    # miss, so readings flow as soon as the plot exists
+                    self.stderr.write(
+                        f"⚠️ Dropping datagram for unknown plot {plot_id}"
+                    )
+                    continue
+                owner_cache[plot_id] = owner_id
+
+            readings = [
+                SensorReading(
+                    plot_id=plot_id,
+                    owner_id=owner_id,
+                    sensor_type=sensor_type,
+                    value=round(value, 2),
+                    source='simulator_udp',
+                )
+                for sensor_type, value in zip(
+                    _SENSOR_FIELDS, (temperature, humidity, moisture)
+                )
+            ]
+            if ts_ns:
+                captured = datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc)
+                for reading in readings:
+                    reading.timestamp = captured
+
+            # A bad datagram (racing plot delete, out-of-range value
+            # hitting a CHECK constraint) must not kill the long-running
+            # listener: log it and move on to the next packet
+            try:
+                SensorReading.objects.bulk_create(readings)
+            except DatabaseError as e:
+                self.stderr.write(
+                    f"⚠️ Dropped datagram for plot {plot_id}: {e}"
+                )
@@ -0,0 +1,85 @@
+# Converts the sensor_reading table into a TimescaleDB hypertable so that
+# ingestion stays flat as the table grows and recent-window queries only scan
+# the latest chunk. The conversion is a no-op on non-PostgreSQL databases and
+# on PostgreSQL servers without the timescaledb extension installed, so the
+# migration is safe to run everywhere (dev, CI, production). Where the
+# extension IS installed, a failed conversion fails the migration - recording
+# it as applied with the table silently unconverted would be worse.
+
+from django.db import migrations
+
+
+def create_hypertable(apps, schema_editor):
+    """Convert sensor_reading to a 1-day-chunked hypertable with compression."""
+    connection = schema_editor.connection
+
+    # Hypertables only exist on PostgreSQL + TimescaleDB
+    if connection.vendor != 'postgresql':
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'"
+        )
+        if cursor.fetchone() is None:
+            # Extension not installed - keep the plain table
+            return
+
+        # TimescaleDB requires every unique index to include the partition
+        # column and rejects foreign keys that reference a hypertable, so
+        # the plain-`id` primary key and the anomaly_event -> sensor_reading
+        # constraint both have to go before the conversion can succeed.
+        # The standard hypertable recipe: the PK becomes (id, timestamp);
+        # anomaly_event.sensor_reading_id keeps its column and index, with
+        # referential integrity enforced at the application layer from here.
+        cursor.execute(
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = 'anomaly_event'::regclass "
+            "AND confrelid = 'sensor_reading'::regclass"
+        )
+        for (conname,) in cursor.fetchall():
+            cursor.execute(
+                f'ALTER TABLE anomaly_event DROP CONSTRAINT "{conname}"'
+            )
+        cursor.execute(
+            "ALTER TABLE sensor_reading DROP CONSTRAINT sensor_reading_pkey"
+        )
+        cursor.execute(
+            'ALTER TABLE sensor_reading ADD PRIMARY KEY (id, "timestamp")'
+        )
+
+        # Partition by timestamp with 1-day chunks; migrate existing rows
+        cursor.execute(
+            "SELECT create_hypertable("
+            "'sensor_reading', 'timestamp', "
+            "chunk_time_interval => INTERVAL '1 day', "
+            "migrate_data => true)"
+        )
+
+        # Compress chunks older than 7 days, segmented by the columns the
+        # dashboard filters on so compressed scans stay selective
+        cursor.execute(
+            "ALTER TABLE sensor_reading SET ("
+            "timescaledb.compress, "
+            "timescaledb.compress_segmentby = 'plot_id,sensor_type')"
+        )
+        cursor.execute(
+            "SELECT add_compression_policy("
+            "'sensor_reading', INTERVAL '7 days')"
+        )
+
+
+def drop_hypertable(apps, schema_editor):
+    """Reverse is a no-op - the hypertable keeps working as a normal table."""
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crop_app', '0002_anomalyevent_sensor_reading_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_hypertable, drop_hypertable),
+    ]
@@ -0,0 +1,45 @@
+# Encodes the per-sensor value ranges as database CHECK constraints so the
+# bulk ingestion path can rely on the database instead of per-row Python
+# validation in the serializer.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crop_app', '0003_sensorreading_hypertable'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='sensorreading',
+            constraint=models.CheckConstraint(
+                check=(
+                    ~models.Q(sensor_type='moisture')
+                    | models.Q(value__gte=0, value__lte=100)
+                ),
+                name='sensor_reading_moisture_range',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='sensorreading',
+            constraint=models.CheckConstraint(
+                check=(
+                    ~models.Q(sensor_type='temperature')
+                    | models.Q(value__gte=-50, value__lte=60)
+                ),
+                name='sensor_reading_temperature_range',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='sensorreading',
+            constraint=models.CheckConstraint(
+                check=(
+                    ~models.Q(sensor_type='humidity')
+                    | models.Q(value__gte=0, value__lte=100)
+                ),
+                name='sensor_reading_humidity_range',
+            ),
+        ),
+    ]
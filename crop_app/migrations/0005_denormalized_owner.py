@@ -0,0 +1,71 @@
+# Denormalizes the farm owner onto SensorReading and AnomalyEvent so the
+# dashboard list filters become a single-column index lookup instead of the
+# plot -> farm -> owner join, and backfills existing rows.
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_owner(apps, schema_editor):
+    """Populate owner_id from plot.farm.owner for all existing rows."""
+    FieldPlot = apps.get_model('crop_app', 'FieldPlot')
+    owner_subquery = Subquery(
+        FieldPlot.objects.filter(pk=OuterRef('plot_id'))
+        .values('farm__owner_id')[:1]
+    )
+
+    for model_name in ('SensorReading', 'AnomalyEvent'):
+        model = apps.get_model('crop_app', model_name)
+        model.objects.filter(owner__isnull=True).update(owner_id=owner_subquery)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('crop_app', '0004_sensorreading_value_range_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sensorreading',
+            name='owner',
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='owned_sensor_readings',
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name='anomalyevent',
+            name='owner',
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='owned_anomaly_events',
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='sensorreading',
+            index=models.Index(
+                fields=['owner', '-timestamp'],
+                name='sensor_reading_owner_ts_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='anomalyevent',
+            index=models.Index(
+                fields=['owner', '-timestamp'],
+                name='anomaly_event_owner_ts_idx',
+            ),
+        ),
+        migrations.RunPython(backfill_owner, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Composite index matching the anomaly-detection hot query: the latest 50
+# readings for a (plot, sensor_type) pair ordered newest-first become a
+# single index range scan instead of a filter + sort.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crop_app', '0005_denormalized_owner'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sensorreading',
+            index=models.Index(
+                fields=['plot', 'sensor_type', '-timestamp'],
+                name='sensor_reading_plot_type_ts',
+            ),
+        ),
+    ]
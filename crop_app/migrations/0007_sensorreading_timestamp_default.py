@@ -0,0 +1,27 @@
+# SensorReading.timestamp moves from auto_now_add to a timezone.now
+# default: identical behavior when the field is omitted, but bulk writers
+# (tests, backfills, the simulators) can now set explicit timestamps
+# instead of sleeping between inserts to get distinct clock values. API
+# clients get the same ability through the ingest serializer, which
+# declares timestamp writable. State-only change - the column itself is
+# untouched.
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crop_app', '0006_sensorreading_plot_type_ts_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='sensorreading',
+            name='timestamp',
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+    ]
@@ -0,0 +1,93 @@
+# crop_app/mixins.py
+"""
+Shared queryset mixins for the list API views.
+Centralizes the owner-based data restriction that every list view repeated.
+"""
+
+from django.db.models import Max
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+
+class OwnerFilteredListMixin:
+    """
+    Restrict list querysets to rows owned by the requesting user.
+
+    - Staff users see everything
+    - Regular users only see rows reachable through `owner_lookup`
+    - The `is_staff` flag is resolved once per request instead of per
+      queryset evaluation
+
+    Views set `owner_lookup` to the ORM path from their model to the
+    owning User (e.g. 'plot__farm__owner').
+    """
+    owner_lookup = None
+
+    def _is_staff(self):
+        # Cache the flag on the request so repeated queryset builds don't
+        # re-run the descriptor chain
+        request = self.request
+        if not hasattr(request, '_is_staff'):
+            request._is_staff = request.user.is_staff
+        return request._is_staff
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.user.is_authenticated and not self._is_staff():
+            queryset = queryset.filter(**{self.owner_lookup: self.request.user})
+        return queryset
+
+
+class ConditionalGetListMixin:
+    """
+    Support conditional GETs on polled list endpoints.
+
+    Dashboards poll these lists on a timer and usually nothing changed.
+    Emits Last-Modified from MAX(timestamp) - a single index probe on the
+    ordered timestamp index - and answers If-Modified-Since polls with
+    304 Not Modified before any serialization work happens.
+
+    Runs inside DRF's dispatch (after JWT authentication), so the
+    owner-filtered queryset is the one being checked.
+    """
+
+    def list(self, request, *args, **kwargs):
+        last_modified = self.get_queryset().aggregate(m=Max('timestamp'))['m']
+
+        if last_modified is not None:
+            if_modified_since = parse_http_date_safe(
+                request.META.get('HTTP_IF_MODIFIED_SINCE', '')
+            )
+            if (if_modified_since is not None
+                    and int(last_modified.timestamp()) <= if_modified_since):
+                return Response(status=status.HTTP_304_NOT_MODIFIED)
+
+        response = super().list(request, *args, **kwargs)
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        return response
+
+
+class FastListSerializationMixin:
+    """
+    Use a compiled row serializer on the list path when available.
+
+    Serializer classes can expose a `fast_list` callable (generated at
+    import time by serializers._compile_list_serializer) that turns a model
+    instance straight into its response dict, bypassing the per-row DRF
+    field machinery. Views without one fall back to the normal list().
+    """
+
+    def list(self, request, *args, **kwargs):
+        fast = getattr(self.get_serializer_class(), 'fast_list', None)
+        if fast is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else queryset
+        data = [fast(o) for o in rows]
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
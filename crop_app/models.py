@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
 
 
 # -------------------- Enumerations/Choices --------------------
@@ -61,7 +62,11 @@ class FieldPlot(models.Model):
 
 
 class SensorReading(models.Model):
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # default instead of auto_now_add: behaves the same when omitted,
+    # but bulk writers and backfills can set explicit timestamps - ORM
+    # callers directly, API clients through the ingest serializer's
+    # writable timestamp field
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     sensor_type = models.CharField(max_length=20, choices=SensorType.choices)
     value = models.FloatField(validators=[MinValueValidator(0), MaxValueValidator(200)])
     source = models.CharField(max_length=100, default="simulator")
@@ -71,6 +76,16 @@ class SensorReading(models.Model):
         on_delete=models.CASCADE,
         related_name='sensor_readings'
     )
+    # Denormalized owner (= plot.farm.owner) so dashboard list filters hit a
+    # single-column index instead of the plot -> farm -> owner join
+    owner = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='owned_sensor_readings'
+    )
 
     class Meta:
         db_table = 'sensor_reading'
@@ -79,10 +94,48 @@ class SensorReading(models.Model):
             models.Index(fields=['sensor_type']),
             models.Index(fields=['timestamp']),
             models.Index(fields=['plot', 'timestamp']),
+            # Matches the detection hot query: latest 50 readings for a
+            # (plot, sensor_type) pair, newest first
+            models.Index(fields=['plot', 'sensor_type', '-timestamp'],
+                         name='sensor_reading_plot_type_ts'),
+            models.Index(fields=['owner', '-timestamp'],
+                         name='sensor_reading_owner_ts_idx'),
+        ]
+        # Per-sensor value ranges enforced by the database itself so the
+        # bulk ingestion path can skip per-row Python validation
+        constraints = [
+            models.CheckConstraint(
+                check=(
+                    ~models.Q(sensor_type=SensorType.MOISTURE)
+                    | models.Q(value__gte=0, value__lte=100)
+                ),
+                name='sensor_reading_moisture_range',
+            ),
+            models.CheckConstraint(
+                check=(
+                    ~models.Q(sensor_type=SensorType.TEMPERATURE)
+                    | models.Q(value__gte=-50, value__lte=60)
+                ),
+                name='sensor_reading_temperature_range',
+            ),
+            models.CheckConstraint(
+                check=(
+                    ~models.Q(sensor_type=SensorType.HUMIDITY)
+                    | models.Q(value__gte=0, value__lte=100)
+                ),
+                name='sensor_reading_humidity_range',
+            ),
         ]
         verbose_name = 'Sensor Reading'
         verbose_name_plural = 'Sensor Readings'
 
+    def save(self, *args, **kwargs):
+        # Keep the denormalized owner in sync on single-row saves; bulk
+        # paths set owner_id explicitly (or rely on the migration backfill)
+        if self.owner_id is None and self.plot_id is not None:
+            self.owner_id = self.plot.farm.owner_id
+        super().save(*args, **kwargs)
+
 
 class AnomalyEvent(models.Model):
     timestamp = models.DateTimeField(auto_now_add=True)
@@ -108,6 +161,16 @@ class AnomalyEvent(models.Model):
         help_text="The sensor reading that triggered this anomaly detection"
     )
 
+    # Denormalized owner (= plot.farm.owner), same rationale as SensorReading
+    owner = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='owned_anomaly_events'
+    )
+
     class Meta:
         db_table = 'anomaly_event'
         ordering = ['-timestamp']
@@ -116,10 +179,17 @@ class AnomalyEvent(models.Model):
             models.Index(fields=['anomaly_type']),
             models.Index(fields=['plot', 'timestamp']),
             models.Index(fields=['sensor_reading']),  # NEW index
+            models.Index(fields=['owner', '-timestamp'],
+                         name='anomaly_event_owner_ts_idx'),
         ]
         verbose_name = 'Anomaly Event'
         verbose_name_plural = 'Anomaly Events'
-    
+
+    def save(self, *args, **kwargs):
+        if self.owner_id is None and self.plot_id is not None:
+            self.owner_id = self.plot.farm.owner_id
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.anomaly_type} - Plot {self.plot_id} - {self.severity}"
 
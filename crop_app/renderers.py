@@ -0,0 +1,26 @@
+# crop_app/renderers.py
+"""
+orjson-backed JSON renderer for the API.
+
+The dashboard list endpoints serialize thousands of float/timestamp rows
+per response; DRF's default json.dumps encoder is pure CPU. orjson encodes
+the same payloads in native code, so the encoding cost on the read path
+mostly disappears.
+"""
+
+import orjson
+from rest_framework import renderers
+
+
+class ORJSONRenderer(renderers.BaseRenderer):
+    media_type = 'application/json'
+    format = 'json'
+    charset = None  # orjson returns UTF-8 bytes
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+        )
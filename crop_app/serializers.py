@@ -4,6 +4,7 @@
 
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db.models import DateTimeField
 from .models import FarmProfile, FieldPlot, SensorReading, AnomalyEvent, AgentRecommendation
 
 
@@ -125,6 +126,29 @@ class FieldPlotSerializer(serializers.ModelSerializer):
 # SENSOR READING SERIALIZER
 # ===================================================================
 
+class SensorReadingListSerializer(serializers.ListSerializer):
+    """
+    Bulk create path for list POSTs.
+
+    DRF's default ListSerializer.create saves rows one at a time - each
+    row paying a farm SELECT (the save() owner sync) and its own
+    autocommitted INSERT. Here the denormalized owners are resolved with
+    one query over the batch's plots and every row lands in a single
+    bulk_create.
+    """
+
+    def create(self, validated_data):
+        owner_by_plot = dict(
+            FieldPlot.objects.filter(
+                pk__in={item['plot'].pk for item in validated_data}
+            ).values_list('pk', 'farm__owner_id')
+        )
+        return SensorReading.objects.bulk_create([
+            SensorReading(owner_id=owner_by_plot[item['plot'].pk], **item)
+            for item in validated_data
+        ])
+
+
 class SensorReadingSerializer(serializers.ModelSerializer):
     """
     Serializer for SensorReading model
@@ -138,11 +162,18 @@ class SensorReadingSerializer(serializers.ModelSerializer):
     # Show plot name in responses (easier to read than just ID)
     plot_name = serializers.CharField(source='plot.plot_name', read_only=True)
 
+    # Writable so backfills (fast_data_generator, bulk POSTs) can carry
+    # their historical capture times; omitted, the model default stamps
+    # the row with now() as before. Declared explicitly because the
+    # model field is editable=False, which would map it read-only.
+    timestamp = serializers.DateTimeField(required=False)
+
     class Meta:
         model = SensorReading
-        fields = ['id', 'timestamp', 'plot', 'plot_name', 
+        fields = ['id', 'timestamp', 'plot', 'plot_name',
                   'sensor_type', 'value', 'source']
-        read_only_fields = ['id','timestamp']  # Auto-set by database
+        read_only_fields = ['id']
+        list_serializer_class = SensorReadingListSerializer  # bulk POSTs
 
     def validate_sensor_type(self, value):
         """
@@ -165,7 +196,15 @@ class SensorReadingSerializer(serializers.ModelSerializer):
         Moisture: 0-100%
         Temperature: -50 to 60°C
         Humidity: 0-100%
+
+        On the bulk ingestion path the same ranges are enforced by the
+        database CHECK constraints, so the per-row Python check is skipped
+        (validation cost becomes O(1) per batch instead of O(rows)).
         """
+        # Bulk path: rely on the DB CHECK constraints instead
+        if self.context.get('bulk'):
+            return value
+
         sensor_type = self.initial_data.get('sensor_type')
         
         # Validate based on sensor type
@@ -239,6 +278,58 @@ class AnomalyEventSerializer(serializers.ModelSerializer):
         read_only_fields = ['timestamp']
 
 
+# ===================================================================
+# COMPILED LIST SERIALIZERS
+# ===================================================================
+
+def _format_datetime(value):
+    """Render a datetime the way DRF does: ISO-8601 with a Z suffix."""
+    if value is None:
+        return None
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def _compile_list_serializer(serializer_cls):
+    """
+    Compile a read-only row serializer for a flat ModelSerializer.
+
+    ModelSerializer.to_representation walks the bound-field machinery for
+    every row on every request, even though the field list never changes
+    after import. For serializers whose fields are all concrete model
+    attributes we can generate the equivalent dict-literal function once,
+    at import time, and skip that machinery entirely on the hot list path.
+    Datetime columns are pre-formatted to DRF's ISO-8601 `Z` convention
+    (a raw datetime would reach orjson and render as `+00:00`), so the
+    compiled output stays byte-compatible with the regular DRF path.
+    """
+    model = serializer_cls.Meta.model
+    model_fields = {f.name: f for f in model._meta.fields}
+    parts = []
+    for field in serializer_cls.Meta.fields:
+        model_field = model_fields.get(field)
+        if model_field is not None and model_field.is_relation:
+            parts.append(f'"{field}": o.{field}_id')
+        elif isinstance(model_field, DateTimeField):
+            parts.append(f'"{field}": _dt(o.{field})')
+        else:
+            parts.append(f'"{field}": o.{field}')
+    code = 'def ser(o):\n    return {' + ', '.join(parts) + '}'
+    namespace = {'_dt': _format_datetime}
+    exec(code, namespace)
+    return namespace['ser']
+
+
+# AgentRecommendation is the only list payload whose fields are all flat
+# concrete columns; the others nest related serializers and keep the
+# regular DRF path.
+AgentRecommendationSerializer.fast_list = staticmethod(
+    _compile_list_serializer(AgentRecommendationSerializer)
+)
+
+
 # ===================================================================
 # USAGE NOTES
 # ===================================================================
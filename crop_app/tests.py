@@ -0,0 +1,86 @@
+"""
+Crop App - Unit Tests
+Tests for the sensor reading ingestion API.
+"""
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from .models import FarmProfile, FieldPlot, SensorReading
+
+
+class SensorReadingIngestTests(TestCase):
+    """Test cases for POST /api/sensor-readings/."""
+
+    def setUp(self):
+        """Set up a plot to ingest against."""
+        self.user = User.objects.create(username='ingest_test_user')
+        farm = FarmProfile.objects.create(
+            owner=self.user,
+            location='Ingest Test Farm',
+            size=1.0,
+            crop_type='wheat',
+        )
+        self.plot = FieldPlot.objects.create(farm=farm, crop_variety='durum')
+
+    def test_posted_timestamp_round_trips(self):
+        """An explicit historical timestamp is stored, not re-stamped."""
+        response = self.client.post(
+            '/api/sensor-readings/',
+            {
+                'plot': self.plot.id,
+                'sensor_type': 'moisture',
+                'value': 55.5,
+                'timestamp': '2024-01-15T06:30:00Z',
+                'source': 'backfill_test',
+            },
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['timestamp'], '2024-01-15T06:30:00Z')
+
+        reading = SensorReading.objects.get(pk=response.json()['id'])
+        self.assertEqual(
+            reading.timestamp.isoformat(), '2024-01-15T06:30:00+00:00'
+        )
+
+    def test_omitted_timestamp_defaults_to_now(self):
+        """Rows posted without a timestamp still get stamped at insert."""
+        response = self.client.post(
+            '/api/sensor-readings/',
+            {
+                'plot': self.plot.id,
+                'sensor_type': 'moisture',
+                'value': 55.5,
+                'source': 'live_test',
+            },
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertIsNotNone(response.json()['timestamp'])
+
+    def test_bulk_post_honors_timestamps(self):
+        """The bulk list path stores each row's explicit timestamp."""
+        payload = [
+            {
+                'plot': self.plot.id,
+                'sensor_type': 'moisture',
+                'value': value,
+                'timestamp': f'2024-01-15T0{hour}:00:00Z',
+                'source': 'bulk_backfill_test',
+            }
+            for hour, value in enumerate((50.0, 51.0, 52.0))
+        ]
+
+        response = self.client.post(
+            '/api/sensor-readings/', payload, content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 201)
+        stored = SensorReading.objects.filter(source='bulk_backfill_test')
+        self.assertEqual(stored.count(), 3)
+        self.assertEqual(
+            sorted(reading.timestamp.hour for reading in stored), [0, 1, 2]
+        )
@@ -1,13 +1,15 @@
 # crop_app/urls.py
 from django.urls import path
-from .views import (          
+from .views import (
     SensorReadingListCreate,
+    SensorExportView,
     AnomalyList,
     RecommendationList
 )
 
 urlpatterns = [
     path('sensor-readings/', SensorReadingListCreate.as_view()),
+    path('sensor-readings/export/', SensorExportView.as_view()),
     path('anomalies/', AnomalyList.as_view()),
     path('recommendations/', RecommendationList.as_view()),
 ]
\ No newline at end of file
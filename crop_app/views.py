@@ -1,16 +1,34 @@
 # crop_app/api_views.py
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
 from rest_framework import generics
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.views import APIView
+from .mixins import (
+    ConditionalGetListMixin, FastListSerializationMixin, OwnerFilteredListMixin
+)
 from .models import SensorReading, AnomalyEvent, AgentRecommendation
 from .serializers import (
     SensorReadingSerializer, AnomalyEventSerializer, AgentRecommendationSerializer
 )
 
+# Map the DB CHECK constraint names (SensorReading.Meta.constraints) to
+# the same messages the single-row validate_value path produces, so bulk
+# callers get field-level errors instead of backend SQL fragments
+_CONSTRAINT_MESSAGES = {
+    'sensor_reading_moisture_range': 'Moisture must be between 0-100%',
+    'sensor_reading_temperature_range': 'Temperature must be between -50 to 60°C',
+    'sensor_reading_humidity_range': 'Humidity must be between 0-100%',
+}
+
+
 # POST /api/sensor-readings/ + GET with ?plot=
-class SensorReadingListCreate(generics.ListCreateAPIView):
+class SensorReadingListCreate(OwnerFilteredListMixin, generics.ListCreateAPIView):
     queryset = SensorReading.objects.all().order_by('-timestamp')
     serializer_class = SensorReadingSerializer
-     
+    owner_lookup = 'owner'  # denormalized plot.farm.owner
+
     def get_permissions(self):
         """
         POST (simulator ingestion) = AllowAny
@@ -20,38 +38,97 @@ class SensorReadingListCreate(generics.ListCreateAPIView):
             return [AllowAny()]  # Simulator can POST without auth
         return [IsAuthenticated()]  # Dashboard needs JWT to GET
 
+    def get_serializer(self, *args, **kwargs):
+        """
+        Accept a list payload for batched ingestion.
+        Bulk POSTs skip the per-row Python range checks - the DB CHECK
+        constraints reject invalid rows instead.
+        """
+        if self.request.method == 'POST' and isinstance(self.request.data, list):
+            kwargs['many'] = True
+        return super().get_serializer(*args, **kwargs)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request.method == 'POST' and isinstance(self.request.data, list):
+            context['bulk'] = True
+        return context
+
+    def create(self, request, *args, **kwargs):
+        """
+        One transaction around the whole POST: either every row commits
+        or none does, and a DB CHECK rejection surfaces as a 400 instead
+        of a 500 with part of the batch already written.
+        """
+        try:
+            with transaction.atomic():
+                return super().create(request, *args, **kwargs)
+        except IntegrityError as e:
+            message = str(e)
+            for name, detail in _CONSTRAINT_MESSAGES.items():
+                if name in message:
+                    raise ValidationError({'value': detail})
+            # Unknown constraint: a fixed message - this endpoint is
+            # AllowAny, so the raw backend error must not leak out
+            raise ValidationError(
+                {'detail': 'Rejected by a database constraint.'}
+            )
+
     def get_queryset(self):
-        queryset = super().get_queryset() 
-       # Only filter by user for authenticated requests (GET)
-        if self.request.user.is_authenticated and not self.request.user.is_staff:
-            queryset = queryset.filter(plot__farm__owner=self.request.user)
-            
-        plot_id = self.request.query_params.get('plot') 
+        # Owner restriction comes from the mixin; add the ?plot= filter
+        queryset = super().get_queryset()
+        plot_id = self.request.query_params.get('plot')
         if plot_id:
             queryset = queryset.filter(plot_id=plot_id)
         return queryset
 
 
+# GET /api/sensor-readings/export/
+class SensorExportView(APIView):
+    """
+    Stream a CSV export of the user's sensor readings.
+
+    Rows are pulled through a server-side cursor (.iterator) and yielded
+    straight into the HTTP response, so peak memory stays constant no
+    matter how many readings the plot has accumulated.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        queryset = SensorReading.objects.order_by('timestamp')
+        if not request.user.is_staff:
+            queryset = queryset.filter(plot__farm__owner=request.user)
+
+        plot_id = request.query_params.get('plot')
+        if plot_id:
+            queryset = queryset.filter(plot_id=plot_id)
+
+        rows = queryset.values_list(
+            'plot_id', 'sensor_type', 'value', 'timestamp'
+        ).iterator(chunk_size=2000)
+
+        def generate():
+            yield 'plot,sensor_type,value,timestamp\n'
+            for plot, sensor_type, value, timestamp in rows:
+                yield f'{plot},{sensor_type},{value},{timestamp.isoformat()}\n'
+
+        response = StreamingHttpResponse(generate(), content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="sensor_readings.csv"'
+        return response
+
+
 # GET /api/anomalies/
-class AnomalyList(generics.ListAPIView):
+class AnomalyList(ConditionalGetListMixin, OwnerFilteredListMixin, generics.ListAPIView):
     queryset = AnomalyEvent.objects.all().order_by('-timestamp')
     serializer_class = AnomalyEventSerializer
     permission_classes = [IsAuthenticated] # Require authentication for viewing data
+    owner_lookup = 'owner'  # denormalized plot.farm.owner
+
 
-    def get_queryset(self):# Restrict to user's farm plots
-        queryset = super().get_queryset()
-        if not self.request.user.is_staff:
-            queryset = queryset.filter(plot__farm__owner=self.request.user)
-        return queryset
-        
 # GET /api/recommendations/
-class RecommendationList(generics.ListAPIView):
+class RecommendationList(ConditionalGetListMixin, FastListSerializationMixin,
+                         OwnerFilteredListMixin, generics.ListAPIView):
     queryset = AgentRecommendation.objects.all().order_by('-timestamp')
     serializer_class = AgentRecommendationSerializer
     permission_classes = [IsAuthenticated]  # Require authentication for viewing data
-
-    def get_queryset(self):  # Restrict to user's farm plots
-        queryset = super().get_queryset()
-        if not self.request.user.is_staff:
-            queryset = queryset.filter(plot_event__plot__farm__owner=self.request.user)
-        return queryset
\ No newline at end of file
+    owner_lookup = 'anomaly_event__owner'  # one join via the denormalized owner
\ No newline at end of file
@@ -43,7 +43,7 @@ INSTALLED_APPS = [
     "django_extensions",
     "crop_app",
     "ml_module",
-    
+    "ai_agent",
 ]
 
 MIDDLEWARE = [
@@ -88,6 +88,11 @@ DATABASES = {
         'PASSWORD': 'mesy',   # The password you just entered
         'HOST': 'localhost',
         'PORT': '5432',
+        # Persistent connections: scripts and request handlers reuse one
+        # connection instead of paying a fork/handshake per statement
+        # burst; health checks guard against reusing a dead one
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -128,6 +133,17 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+# Cache backend used for per-view response caching (cache_page) and small
+# hot lookups. Local-memory cache by default; point at Redis in production:
+# 'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+# 'LOCATION': 'redis://127.0.0.1:6379'
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'crop-monitoring',
+    }
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -142,6 +158,12 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 50,
+    # orjson encodes the numeric-heavy list payloads in native code;
+    # keep the browsable API for manual inspection during development
+    'DEFAULT_RENDERER_CLASSES': (
+        'crop_app.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 
 
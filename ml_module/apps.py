@@ -0,0 +1,40 @@
+"""
+ML Module - App configuration.
+Warms the detector cache at process startup.
+"""
+
+import os
+import sys
+
+from django.apps import AppConfig
+
+
+class MlModuleConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'ml_module'
+
+    def ready(self):
+        # Load the saved models during startup so the first detect
+        # request after a deploy doesn't pay the disk-load cost - but
+        # only in processes that will actually serve detect requests.
+        # Under manage.py, that's the runserver child (the autoreloader
+        # parent imports apps too, but only the child gets
+        # RUN_MAIN='true'; --noreload runs a single unmarked process).
+        # Other subcommands (migrate, shell, ...) skip the warm-up.
+        # WSGI servers like gunicorn don't go through manage.py and
+        # always warm the cache.
+        prog = os.path.basename(sys.argv[0])
+        if prog in ('manage.py', 'django-admin', 'django-admin.py'):
+            command = sys.argv[1] if len(sys.argv) > 1 else ''
+            if command != 'runserver':
+                return
+            if (os.environ.get('RUN_MAIN') != 'true'
+                    and '--noreload' not in sys.argv):
+                return
+
+        from .detector_registry import get_or_create_detector
+        for sensor_type in ('moisture', 'temperature', 'humidity'):
+            try:
+                get_or_create_detector(sensor_type)
+            except Exception as e:
+                print(f"⚠️ Could not preload {sensor_type} detector: {e}")
@@ -0,0 +1,85 @@
+"""
+ML Module - Detector Registry
+Single source of truth for the per-process detector cache.
+
+Every code path that needs a trained detector (views, app startup
+preloading, management scripts) goes through get_or_create_detector, so
+each sensor type's model is loaded into RAM exactly once per process.
+"""
+
+from collections import defaultdict
+import functools
+import threading
+import os
+
+from django.conf import settings
+
+from .anomaly_detector import IsolationForestDetector
+
+
+# Directory to store trained models
+MODEL_DIR = os.path.join(settings.BASE_DIR, 'trained_models')
+
+# Create directory if it doesn't exist
+if not os.path.exists(MODEL_DIR):
+    os.makedirs(MODEL_DIR)
+
+
+def get_model_path(sensor_type: str) -> str:
+    """Get file path for a sensor type's model."""
+    return os.path.join(MODEL_DIR, f'{sensor_type}_model.pkl')
+
+
+# One lock per sensor type so concurrent cold requests don't both
+# deserialize the same model file
+_detector_locks = defaultdict(threading.Lock)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_detector(sensor_type: str, model_mtime: float) -> IsolationForestDetector:
+    """
+    Load a detector from disk (or create an untrained one).
+
+    The model file's mtime is part of the cache key, so when another
+    worker retrains and rewrites the file this worker picks up the new
+    model on its next request instead of serving a stale copy forever.
+    """
+    detector = IsolationForestDetector(contamination=0.1)
+
+    if model_mtime:
+        model_path = get_model_path(sensor_type)
+        try:
+            detector.load_model(model_path)
+            print(f"✅ Loaded {sensor_type} model from disk")
+        except Exception as e:
+            print(f"⚠️ Failed to load {sensor_type} model from disk: {e}")
+
+    return detector
+
+
+def get_or_create_detector(sensor_type: str) -> IsolationForestDetector:
+    """
+    Get cached detector or load from disk.
+
+    Args:
+        sensor_type: Sensor type (moisture, temperature, humidity)
+
+    Returns:
+        IsolationForestDetector instance
+    """
+    try:
+        model_mtime = os.path.getmtime(get_model_path(sensor_type))
+    except OSError:
+        model_mtime = 0.0
+
+    # Serialize per sensor type: without this, two concurrent cold
+    # requests would both run the disk load (lru_cache only caches the
+    # result, it doesn't dedupe in-flight computation). Warm hits just
+    # take an uncontended lock around a dict lookup.
+    with _detector_locks[sensor_type]:
+        return _load_detector(sensor_type, model_mtime)
+
+
+def clear_detector_cache():
+    """Drop cached detectors (call after retraining rewrites a model)."""
+    _load_detector.cache_clear()
@@ -134,9 +134,9 @@ class DetectAnomaliesResponseSerializer(serializers.Serializer):
     sensor_type = serializers.CharField()
     total_windows = serializers.IntegerField()
     anomalies_detected = serializers.IntegerField()
-    anomaly_events_created = serializers.ListField(
-        child=serializers.IntegerField()
-    )
+    # Events are persisted by a background writer after the response is
+    # sent, so the payload carries a queued count rather than row ids
+    anomaly_events_queued = serializers.IntegerField()
     results = AnomalyWindowSerializer(many=True)
 
 
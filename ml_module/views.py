@@ -13,8 +13,11 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connections, transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
 
 from .serializers import (
     TrainModelSerializer,
@@ -25,10 +28,17 @@ from .serializers import (
     BatchDetectResponseSerializer,
     ModelStatusSerializer
 )
-from .anomaly_detector import IsolationForestDetector
-from .preprocessing import get_recent_readings
+from .anomaly_detector import _SEV_CODE_LABELS
+from .detector_registry import (
+    get_model_path,
+    get_or_create_detector,
+    clear_detector_cache,
+)
+from .preprocessing import SensorDataPreprocessor, get_recent_readings
 from crop_app.models import SensorReading, AnomalyEvent, FieldPlot
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import uuid
 import numpy as np
 import os
 
@@ -37,53 +47,257 @@ import os
 # MODEL MANAGEMENT
 # ============================================================================
 
-# Directory to store trained models
-MODEL_DIR = os.path.join(settings.BASE_DIR, 'trained_models')
+# The detector cache itself lives in detector_registry so every code path
+# (views, app startup preloading) shares one set of loaded models.
+
+# One shared preprocessor: the feature pipeline is stateless for a given
+# window size, so there is no need to re-import and re-construct it inside
+# every request handler
+_PREPROCESSOR = SensorDataPreprocessor(window_size=10)
+
+
+# ============================================================================
+# BACKGROUND BATCH DETECTION
+# ============================================================================
+
+# Batch-detect job state lives in the configured cache backend, not a
+# module dict: entries expire instead of accumulating for the lifetime
+# of the worker, and with a shared backend (Redis in production - see
+# CACHES in settings) status polls can land on any worker process, not
+# just the one that accepted the job.
+_BATCH_JOB_TTL = 60 * 60
 
-# Create directory if it doesn't exist
-if not os.path.exists(MODEL_DIR):
-    os.makedirs(MODEL_DIR)
 
-# Global detector cache (loaded from disk on first use)
-_detector_cache = {}
+def _batch_job_key(job_id):
+    return f'ml_batch_job:{job_id}'
 
 
-def get_model_path(sensor_type: str) -> str:
-    """Get file path for a sensor type's model."""
-    return os.path.join(MODEL_DIR, f'{sensor_type}_model.pkl')
+def _persist_anomaly_events(event_dicts):
+    """Background writer: one bulk insert for a queued batch of events."""
+    try:
+        with transaction.atomic():
+            AnomalyEvent.objects.bulk_create(
+                [AnomalyEvent(**d) for d in event_dicts], batch_size=500
+            )
+    except Exception as e:
+        print(f"⚠️ Failed to persist {len(event_dicts)} anomaly events: {e}")
+    finally:
+        # The worker thread gets its own DB connection; release it
+        connections.close_all()
 
 
-def get_or_create_detector(sensor_type: str) -> IsolationForestDetector:
+# Single worker so queued writes stay ordered and hold at most one extra
+# DB connection. The stack has no task broker, so a dedicated thread
+# stands in for the usual Celery task: the response returns as soon as
+# scoring is done and the insert happens behind it.
+_persist_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix='anomaly-persist'
+)
+
+
+_SEVERITY_MAP = {
+    'NORMAL': 'low',
+    'MINOR': 'low',
+    'WARNING': 'medium',
+    'CRITICAL': 'high'
+}
+
+
+def _scan_sensor_type(sensor_type, valid_plot_ids, readings_by_pair, plots):
     """
-    Get cached detector or load from disk.
-    
-    Args:
-        sensor_type: Sensor type (moisture, temperature, humidity)
-    
-    Returns:
-        IsolationForestDetector instance
+    Score one sensor type across all plots.
+
+    Runs entirely on prefetched data - no DB access - so several sensor
+    types can be scanned concurrently. Returns (results, pending_events).
     """
-    # Check RAM cache first
-    if sensor_type in _detector_cache:
-        return _detector_cache[sensor_type]
-    
-    # Try to load from disk
-    model_path = get_model_path(sensor_type)
-    
-    if os.path.exists(model_path):
-        try:
-            # Load from disk
-            detector = IsolationForestDetector.load_model(model_path)
-            _detector_cache[sensor_type] = detector
-            print(f"✅ Loaded {sensor_type} model from disk")
-            return detector
-        except Exception as e:
-            print(f"⚠️ Failed to load {sensor_type} model from disk: {e}")
-    
-    # Create new detector if not found
-    detector = IsolationForestDetector(contamination=0.1)
-    _detector_cache[sensor_type] = detector
-    return detector
+    results = []
+    pending_events = []
+
+    detector = get_or_create_detector(sensor_type)
+
+    if not detector.is_trained:
+        for plot_id in valid_plot_ids:
+            results.append({
+                'plot_id': plot_id,
+                'sensor_type': sensor_type,
+                'status': 'skipped',
+                'reason': 'model not trained'
+            })
+        return results, pending_events
+
+    # Preprocess each plot's block; remember its slice of the buffer
+    blocks = []
+    for plot_id in valid_plot_ids:
+        readings_list = readings_by_pair.get((plot_id, sensor_type), [])
+        values = [r['value'] for r in readings_list]
+
+        if len(values) < 10:
+            results.append({
+                'plot_id': plot_id,
+                'sensor_type': sensor_type,
+                'status': 'skipped',
+                'reason': 'insufficient data'
+            })
+            continue
+
+        processed = _PREPROCESSOR.prepare_for_model(values, use_features=True)
+        blocks.append((plot_id, readings_list, processed))
+
+    if not blocks:
+        return results, pending_events
+
+    # One pre-allocated buffer, filled block by block
+    n_total = sum(block[2].shape[0] for block in blocks)
+    buf = np.empty((n_total, blocks[0][2].shape[1]), dtype=np.float32)
+    offset = 0
+    for _, _, processed in blocks:
+        buf[offset:offset + processed.shape[0]] = processed
+        offset += processed.shape[0]
+
+    # Array-valued detection: only the (usually few) anomalous windows
+    # ever become Python objects; normal windows stay in the arrays
+    is_anom, _scores, confidence, sev_codes = detector.detect_vectorized(buf)
+    anom_idx = np.flatnonzero(is_anom)
+
+    # Map rows back to their (plot, sensor) pair via the offsets
+    offset = 0
+    for plot_id, readings_list, processed in blocks:
+        n_windows = processed.shape[0]
+        block_idx = anom_idx[(anom_idx >= offset) & (anom_idx < offset + n_windows)]
+
+        # ✅ FIX: Create events with proper ForeignKeys
+        for global_index in block_idx.tolist():
+            # Indices are global in the buffer; rebase to the block
+            window_index = global_index - offset
+            if window_index < len(readings_list):
+                sensor_reading_id = readings_list[window_index]['id']
+            else:
+                sensor_reading_id = readings_list[0]['id']
+
+            severity = _SEVERITY_MAP.get(
+                _SEV_CODE_LABELS[sev_codes[global_index]], 'medium'
+            )
+
+            # ✅ CORRECT: scalar *_id assignments skip the FK descriptor's
+            # instance check; ids come from the prefetched rows
+            pending_events.append(AnomalyEvent(
+                plot_id=plot_id,
+                owner_id=plots[plot_id].farm.owner_id,
+                sensor_reading_id=sensor_reading_id,
+                anomaly_type=f'{sensor_type}_anomaly',
+                severity=severity,
+                model_confidence=float(confidence[global_index])
+            ))
+
+        results.append({
+            'plot_id': plot_id,
+            'sensor_type': sensor_type,
+            'status': 'success',
+            'anomalies_detected': int(block_idx.size)
+        })
+        offset += n_windows
+
+    return results, pending_events
+
+
+def _execute_batch_detect(plot_ids, sensor_types):
+    """Run the full plot x sensor scan and return the summary payload."""
+
+    results = []
+    # Events from every (plot, sensor) pair are accumulated here and
+    # written with a single bulk_create at the end
+    pending_events = []
+
+    # ✅ Bulk prefetch: one query for the plots and one for the recent
+    # readings of every (plot, sensor) pair, instead of O(plots ×
+    # sensors) round-trips inside the loop
+    plots = FieldPlot.objects.select_related('farm').in_bulk(plot_ids)
+
+    # row_number() over (plot, sensor) partitions lets Postgres keep only
+    # the 50 newest rows per pair; without it the query streams a pair's
+    # entire history just to be truncated in Python
+    readings_by_pair = {}
+    reading_rows = SensorReading.objects.filter(
+        plot_id__in=plot_ids,
+        sensor_type__in=sensor_types
+    ).annotate(
+        rn=Window(
+            expression=RowNumber(),
+            partition_by=[F('plot_id'), F('sensor_type')],
+            order_by=F('timestamp').desc()
+        )
+    ).filter(rn__lte=50).order_by(
+        'plot_id', 'sensor_type', '-timestamp'
+    ).values('id', 'plot_id', 'sensor_type', 'value')
+    for row in reading_rows.iterator(chunk_size=2000):
+        readings_by_pair.setdefault(
+            (row['plot_id'], row['sensor_type']), []
+        ).append(row)
+
+    for plot_id in plot_ids:
+        if plot_id not in plots:
+            results.append({
+                'plot_id': plot_id,
+                'sensor_type': 'all',
+                'status': 'error',
+                'error': f'Plot {plot_id} does not exist'
+            })
+    valid_plot_ids = [pid for pid in plot_ids if pid in plots]
+
+    # Scan the sensor types concurrently: each one uses its own detector
+    # and its own slice of the prefetched rows, so the per-sensor work is
+    # independent and the sklearn/numba scoring releases the GIL. All DB
+    # access (prefetch above, bulk_create below) stays on this thread, so
+    # the workers never open their own connections.
+    with ThreadPoolExecutor(max_workers=min(len(sensor_types), 4)) as pool:
+        futures = [
+            pool.submit(_scan_sensor_type, sensor_type, valid_plot_ids,
+                        readings_by_pair, plots)
+            for sensor_type in sensor_types
+        ]
+        for sensor_type, future in zip(sensor_types, futures):
+            try:
+                sensor_results, sensor_events = future.result()
+                results.extend(sensor_results)
+                pending_events.extend(sensor_events)
+            except Exception as e:
+                results.append({
+                    'plot_id': 'all',
+                    'sensor_type': sensor_type,
+                    'status': 'error',
+                    'error': str(e)
+                })
+
+    # One multi-row INSERT for the whole batch instead of one
+    # transaction round-trip per anomaly
+    if pending_events:
+        with transaction.atomic():
+            AnomalyEvent.objects.bulk_create(pending_events, batch_size=500)
+
+    response_data = {
+        'success': True,
+        'results': results,
+        'total_processed': len(results),
+        'total_anomalies': sum(r.get('anomalies_detected', 0) for r in results)
+    }
+
+    return response_data
+
+
+def _run_batch_detect_job(job_id, plot_ids, sensor_types):
+    """Thread target: run the scan and publish the result for polling."""
+    try:
+        result = _execute_batch_detect(plot_ids, sensor_types)
+        cache.set(_batch_job_key(job_id),
+                  {'status': 'done', 'result': result},
+                  timeout=_BATCH_JOB_TTL)
+    except Exception as e:
+        cache.set(_batch_job_key(job_id),
+                  {'status': 'error', 'error': str(e)},
+                  timeout=_BATCH_JOB_TTL)
+    finally:
+        # Each thread gets its own DB connection; release it
+        connections.close_all()
 
 
 # ============================================================================
@@ -143,13 +357,15 @@ class MLViewSet(viewsets.ViewSet):
                     )
                 
                 # Preprocess
-                from .preprocessing import SensorDataPreprocessor
-                preprocessor = SensorDataPreprocessor(window_size=10)
-                training_data = preprocessor.prepare_for_model(values, use_features=True)
+                training_data = _PREPROCESSOR.prepare_for_model(values, use_features=True)
             
             # Option 2: Use provided training data
             elif serializer.validated_data.get('training_data'):
-                training_data = np.array(serializer.validated_data['training_data'])
+                # float32 halves memory traffic during fit; sklearn's
+                # IsolationForest accepts it natively
+                training_data = np.asarray(
+                    serializer.validated_data['training_data'], dtype=np.float32
+                )
             
             else:
                 return Response(
@@ -164,6 +380,11 @@ class MLViewSet(viewsets.ViewSet):
             model_path = get_model_path(sensor_type)
             detector.save_model(model_path)
             print(f"💾 Saved {sensor_type} model to {model_path}")
+
+            # Drop entries keyed on the old file mtime so this worker
+            # serves the freshly trained model immediately
+            clear_detector_cache()
+            cache.delete('ml_status')
             
             # Format response
             response_data = {
@@ -212,21 +433,38 @@ class MLViewSet(viewsets.ViewSet):
             
             # ✅ FIX 1: Get the FieldPlot object (not just the ID)
             try:
-                plot = FieldPlot.objects.get(id=plot_id)
+                plot = FieldPlot.objects.select_related('farm').get(id=plot_id)
             except FieldPlot.DoesNotExist:
                 return Response(
                     {'error': f'Plot {plot_id} does not exist'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Get recent readings WITH objects (not just values)
-            readings_qs = SensorReading.objects.filter(
+            # Memoize on the newest reading id: repeated polls for a pair
+            # whose data hasn't advanced replay the previous result (and
+            # its created event ids) instead of re-walking the forest
+            last_id = SensorReading.objects.filter(
+                plot=plot, sensor_type=sensor_type
+            ).order_by('-id').values_list('id', flat=True).first()
+            cache_key = f'ml_detect:{plot_id}:{sensor_type}:{last_id}'
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return Response(cached, status=status.HTTP_200_OK)
+
+            # Fetch only (id, value) pairs: the id is all that is needed
+            # to link events back to readings, so no SensorReading model
+            # instances are built
+            rows = list(SensorReading.objects.filter(
                 plot=plot,
                 sensor_type=sensor_type
-            ).order_by('-timestamp')[:50]
-            
-            readings_list = list(readings_qs)
-            values = [r.value for r in readings_list]
+            ).order_by('-timestamp').values_list('id', 'value')[:50])
+            # Structure-of-arrays split: ids stay a plain list for the FK
+            # linkage, values land in one contiguous float32 buffer that
+            # preprocessing consumes without re-boxing each float
+            reading_ids = [row[0] for row in rows]
+            values = np.fromiter(
+                (row[1] for row in rows), dtype=np.float32, count=len(rows)
+            )
             
             if len(values) < 10:
                 return Response(
@@ -235,9 +473,7 @@ class MLViewSet(viewsets.ViewSet):
                 )
             
             # Preprocess
-            from .preprocessing import SensorDataPreprocessor
-            preprocessor = SensorDataPreprocessor(window_size=10)
-            processed_data = preprocessor.prepare_for_model(values, use_features=True)
+            processed_data = _PREPROCESSOR.prepare_for_model(values, use_features=True)
             
             # Detect anomalies
             results = detector.detect_with_confidence(processed_data)
@@ -245,47 +481,58 @@ class MLViewSet(viewsets.ViewSet):
             # Filter to show only anomalies
             anomalies = [r for r in results if r['is_anomaly']]
             
-            # ✅ FIX 2: Create AnomalyEvent records with proper ForeignKeys
-            created_events = []
+            # ✅ FIX 2: Create AnomalyEvent records with proper ForeignKeys.
+            # Built in memory and written with one bulk_create instead of
+            # one INSERT round-trip per anomaly.
+            severity_map = {
+                'NORMAL': 'low',
+                'MINOR': 'low',
+                'WARNING': 'medium',
+                'CRITICAL': 'high'
+            }
+            events = []
             for i, anomaly in enumerate(anomalies):
                 # Get the sensor reading that corresponds to this window
                 window_index = anomaly.get('index', i)
-                
+
                 # Get the most recent reading in this window (first reading of the window)
-                if window_index < len(readings_list):
-                    sensor_reading = readings_list[window_index]
-                else:
-                    sensor_reading = readings_list[0]  # Fallback to most recent
-                
-                # Map severity to model choices
-                severity_map = {
-                    'NORMAL': 'low',
-                    'MINOR': 'low',
-                    'WARNING': 'medium',
-                    'CRITICAL': 'high'
-                }
+                if window_index >= len(reading_ids):
+                    window_index = 0  # Fallback to most recent
+
                 severity = severity_map.get(anomaly['severity'], 'medium')
-                
-                # ✅ CORRECT: Use plot=plot_object and sensor_reading=reading_object
-                event = AnomalyEvent.objects.create(
-                    plot=plot,  # ← ForeignKey to FieldPlot object
-                    sensor_reading=sensor_reading,  # ← ForeignKey to SensorReading object
-                    anomaly_type=f'{sensor_type}_anomaly',
-                    severity=severity,
-                    model_confidence=anomaly['confidence']
-                )
-                created_events.append(event.id)
-            
+
+                # ✅ CORRECT: link by id - skips hydrating the reading object
+                # Plain dicts with *_id scalars so the payload crosses the
+                # thread boundary without carrying ORM instances
+                # (bulk_create skips save(), so the denormalized owner is
+                # set explicitly here)
+                events.append({
+                    'plot_id': plot_id,
+                    'owner_id': plot.farm.owner_id,
+                    'sensor_reading_id': reading_ids[window_index],
+                    'anomaly_type': f'{sensor_type}_anomaly',
+                    'severity': severity,
+                    'model_confidence': anomaly['confidence']
+                })
+
+            # Hand the insert to the background writer and respond now:
+            # ingestion callers care about the scores, not about waiting
+            # for the events to hit the database
+            if events:
+                _persist_executor.submit(_persist_anomaly_events, events)
+
             response_data = {
                 'success': True,
                 'plot_id': plot_id,
                 'sensor_type': sensor_type,
                 'total_windows': len(results),
                 'anomalies_detected': len(anomalies),
-                'anomaly_events_created': created_events,
+                'anomaly_events_queued': len(events),
                 'results': results
             }
-            
+
+            cache.set(cache_key, response_data, timeout=60)
+
             return Response(response_data, status=status.HTTP_200_OK)
         
         except Exception as e:
@@ -299,7 +546,10 @@ class MLViewSet(viewsets.ViewSet):
     def batch_detect(self, request):
         """
         Run anomaly detection on all plots and sensors.
-        
+
+        The scan runs in a background thread; the response carries a
+        job_id to poll via GET /api/ml/batch-status/.
+
         POST /api/ml/batch-detect/
         Body:
         {
@@ -319,110 +569,47 @@ class MLViewSet(viewsets.ViewSet):
         if not plot_ids:
             plot_ids = list(FieldPlot.objects.values_list('id', flat=True))
         
-        results = []
-        
-        for plot_id in plot_ids:
-            # ✅ FIX: Get the FieldPlot object
-            try:
-                plot = FieldPlot.objects.get(id=plot_id)
-            except FieldPlot.DoesNotExist:
-                results.append({
-                    'plot_id': plot_id,
-                    'sensor_type': 'all',
-                    'status': 'error',
-                    'error': f'Plot {plot_id} does not exist'
-                })
-                continue
-            
-            for sensor_type in sensor_types:
-                try:
-                    detector = get_or_create_detector(sensor_type)
-                    
-                    if not detector.is_trained:
-                        results.append({
-                            'plot_id': plot_id,
-                            'sensor_type': sensor_type,
-                            'status': 'skipped',
-                            'reason': 'model not trained'
-                        })
-                        continue
-                    
-                    # Get and process data WITH objects
-                    readings_qs = SensorReading.objects.filter(
-                        plot=plot,
-                        sensor_type=sensor_type
-                    ).order_by('-timestamp')[:50]
-                    
-                    readings_list = list(readings_qs)
-                    values = [r.value for r in readings_list]
-                    
-                    if len(values) < 10:
-                        results.append({
-                            'plot_id': plot_id,
-                            'sensor_type': sensor_type,
-                            'status': 'skipped',
-                            'reason': 'insufficient data'
-                        })
-                        continue
-                    
-                    # Preprocess and detect
-                    from .preprocessing import SensorDataPreprocessor
-                    preprocessor = SensorDataPreprocessor(window_size=10)
-                    processed_data = preprocessor.prepare_for_model(values, use_features=True)
-                    
-                    detections = detector.detect_with_confidence(processed_data)
-                    anomalies = [d for d in detections if d['is_anomaly']]
-                    
-                    # ✅ FIX: Create events with proper ForeignKeys
-                    for i, anomaly in enumerate(anomalies):
-                        # Get corresponding sensor reading
-                        window_index = anomaly.get('index', i)
-                        if window_index < len(readings_list):
-                            sensor_reading = readings_list[window_index]
-                        else:
-                            sensor_reading = readings_list[0]
-                        
-                        # Map severity
-                        severity_map = {
-                            'NORMAL': 'low',
-                            'MINOR': 'low',
-                            'WARNING': 'medium',
-                            'CRITICAL': 'high'
-                        }
-                        severity = severity_map.get(anomaly['severity'], 'medium')
-                        
-                        # ✅ CORRECT: Use ForeignKey objects
-                        AnomalyEvent.objects.create(
-                            plot=plot,
-                            sensor_reading=sensor_reading,
-                            anomaly_type=f'{sensor_type}_anomaly',
-                            severity=severity,
-                            model_confidence=anomaly['confidence']
-                        )
-                    
-                    results.append({
-                        'plot_id': plot_id,
-                        'sensor_type': sensor_type,
-                        'status': 'success',
-                        'anomalies_detected': len(anomalies)
-                    })
-                
-                except Exception as e:
-                    results.append({
-                        'plot_id': plot_id,
-                        'sensor_type': sensor_type,
-                        'status': 'error',
-                        'error': str(e)
-                    })
-        
-        response_data = {
-            'success': True,
-            'results': results,
-            'total_processed': len(results),
-            'total_anomalies': sum(r.get('anomalies_detected', 0) for r in results)
-        }
-        
-        return Response(response_data, status=status.HTTP_200_OK)
+        # Offload the scan to a worker thread and return immediately:
+        # scanning every plot x sensor pair can hold an HTTP worker for
+        # many seconds, and the client only needs a handle to poll
+        job_id = uuid.uuid4().hex
+        cache.set(_batch_job_key(job_id), {'status': 'running'},
+                  timeout=_BATCH_JOB_TTL)
+
+        threading.Thread(
+            target=_run_batch_detect_job,
+            args=(job_id, plot_ids, sensor_types),
+            daemon=True
+        ).start()
+
+        return Response(
+            {
+                'success': True,
+                'job_id': job_id,
+                'status': 'running',
+                'status_url': f'/api/ml/batch-status/?job_id={job_id}'
+            },
+            status=status.HTTP_202_ACCEPTED
+        )
+
+
+    @action(detail=False, methods=['get'], url_path='batch-status')
+    def batch_status(self, request):
+        """
+        Poll a batch-detect job.
+
+        GET /api/ml/batch-status/?job_id=<id>
+        """
+        job_id = request.query_params.get('job_id')
+        job = cache.get(_batch_job_key(job_id)) if job_id else None
+
+        if job is None:
+            return Response(
+                {'error': f'Unknown or expired job_id: {job_id}'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        return Response({'job_id': job_id, **job}, status=status.HTTP_200_OK)
     
     
     @action(detail=False, methods=['get'], url_path='status')
@@ -432,13 +619,19 @@ class MLViewSet(viewsets.ViewSet):
         
         GET /api/ml/status/
         """
+        # The payload only changes when a model is (re)trained, so serve
+        # the cached copy to pollers; train() deletes the key
+        status_info = cache.get('ml_status')
+        if status_info is not None:
+            return Response(status_info, status=status.HTTP_200_OK)
+
         status_info = {}
-        
+
         for sensor_type in ['moisture', 'temperature', 'humidity']:
             detector = get_or_create_detector(sensor_type)
             model_path = get_model_path(sensor_type)
             model_exists_on_disk = os.path.exists(model_path)
-            
+
             status_info[sensor_type] = {
                 'trained': detector.is_trained,
                 'training_data_size': detector.training_data_size,
@@ -446,5 +639,7 @@ class MLViewSet(viewsets.ViewSet):
                 'saved_to_disk': model_exists_on_disk,
                 'model_path': model_path if model_exists_on_disk else None
             }
-        
+
+        cache.set('ml_status', status_info, timeout=30)
+
         return Response(status_info, status=status.HTTP_200_OK)
\ No newline at end of file
@@ -16,7 +16,12 @@ import numpy as np
 
 class AnomalyScenario:
     """Base class for anomaly scenarios."""
-    
+
+    # Scenarios are consulted on every reading of every cycle; a fixed
+    # slot layout keeps the instances small and attribute access fast
+    __slots__ = ('name', 'description', 'start_hour', 'duration_minutes',
+                 'is_active', 'start_time', '_mask_cache')
+
     def __init__(self, name: str, description: str, 
                  start_hour: float, duration_minutes: float):
         """
@@ -34,7 +39,9 @@ class AnomalyScenario:
         self.duration_minutes = duration_minutes
         self.is_active = False
         self.start_time = None
-    
+        # Cached (hours-axis key, mask) for the vectorized path
+        self._mask_cache = None
+
     def should_activate(self, hours_since_start: float) -> bool:
         """Check if anomaly should activate."""
         return hours_since_start >= self.start_hour and not self.is_active
@@ -66,6 +73,47 @@ class AnomalyScenario:
         """
         return normal_value
 
+    def window_mask(self, hours_since_start: np.ndarray) -> np.ndarray:
+        """
+        Boolean mask of the timesteps that fall inside this scenario's
+        window. Used by the vectorized historical path, where the
+        schedule comes from the hours axis instead of the wall clock.
+        The generator reuses one hours axis across sensors and plots, so
+        the mask is computed once per run and cached on the instance.
+        """
+        key = (id(hours_since_start), hours_since_start.shape[0])
+        if self._mask_cache is not None and self._mask_cache[0] == key:
+            return self._mask_cache[1]
+        end_hour = self.start_hour + self.duration_minutes / 60.0
+        mask = (
+            (hours_since_start >= self.start_hour)
+            & (hours_since_start < end_hour)
+        )
+        self._mask_cache = (key, mask)
+        return mask
+
+    def window_progress(self, hours_since_start: np.ndarray) -> np.ndarray:
+        """Per-timestep progress (0-1) through the scenario window."""
+        elapsed_minutes = (hours_since_start - self.start_hour) * 60.0
+        return np.clip(elapsed_minutes / self.duration_minutes, 0.0, 1.0)
+
+    def modify_series(self, sensor_type: str, values: np.ndarray,
+                      hours_since_start: np.ndarray) -> np.ndarray:
+        """
+        Vectorized counterpart of modify_reading: transform a whole value
+        series in one pass instead of one call per reading.
+        """
+        return values
+
+    def modify_batch(self, sensor_type: str,
+                     values: np.ndarray) -> np.ndarray:
+        """
+        Live-cycle counterpart of modify_reading: one array holding the
+        cycle's values for every plot, modified in a single vector op.
+        Only called while the scenario is active, so no window check.
+        """
+        return values
+
 
 class SuddenDropScenario(AnomalyScenario):
     """
@@ -73,7 +121,9 @@ class SuddenDropScenario(AnomalyScenario):
     Effect: Moisture drops rapidly (>20% in short time)
     FAST VERSION: Drops dramatically within 10 minutes!
     """
-    
+
+    __slots__ = ('target_drop',)
+
     def __init__(self, start_hour: float = 0.0, duration_minutes: float = 15,
                  target_drop: float = 25.0):
         """
@@ -106,9 +156,33 @@ class SuddenDropScenario(AnomalyScenario):
             
             # Allow lower minimum for more dramatic effect
             return max(25.0, normal_value - drop)  # Changed from 30.0 to 25.0
-        
+
         return normal_value
 
+    def modify_series(self, sensor_type: str, values: np.ndarray,
+                      hours_since_start: np.ndarray) -> np.ndarray:
+        if sensor_type != 'moisture':
+            return values
+
+        mask = self.window_mask(hours_since_start)
+        progress = self.window_progress(hours_since_start)
+
+        # Same FAST exponential drop, computed for all timesteps at once
+        drop = self.target_drop * (1 - np.exp(-5 * progress))
+        return np.where(mask, np.maximum(25.0, values - drop), values)
+
+    def modify_batch(self, sensor_type: str,
+                     values: np.ndarray) -> np.ndarray:
+        if sensor_type != 'moisture':
+            return values
+
+        # Progress is the same for every plot within a cycle, so the
+        # drop is a scalar broadcast over the whole array
+        elapsed_minutes = (datetime.now() - self.start_time).total_seconds() / 60
+        progress = min(1.0, elapsed_minutes / self.duration_minutes)
+        drop = self.target_drop * (1 - np.exp(-5 * progress))
+        return np.maximum(25.0, values - drop)
+
 
 class SpikeScenario(AnomalyScenario):
     """
@@ -116,7 +190,9 @@ class SpikeScenario(AnomalyScenario):
     Effect: Random extreme spikes in sensor readings
     FAST VERSION: Higher spike probability for immediate detection!
     """
-    
+
+    __slots__ = ('spike_probability', 'affected_sensor')
+
     def __init__(self, start_hour: float = 0.0, duration_minutes: float = 15,
                  spike_probability: float = 0.5, affected_sensor: str = 'all'):
         """
@@ -167,9 +243,51 @@ class SpikeScenario(AnomalyScenario):
                     np.random.uniform(10, 20),   # Extremely dry
                     np.random.uniform(90, 98)    # Extremely humid
                 ])
-        
+
         return normal_value
 
+    # (low_min, low_max, high_min, high_max) spike ranges per sensor
+    SPIKE_RANGES = {
+        'moisture': (10, 25, 85, 95),
+        'temperature': (0, 8, 38, 45),
+        'humidity': (10, 20, 90, 98),
+    }
+
+    def modify_series(self, sensor_type: str, values: np.ndarray,
+                      hours_since_start: np.ndarray) -> np.ndarray:
+        if self.affected_sensor != 'all' and sensor_type != self.affected_sensor:
+            return values
+        if sensor_type not in self.SPIKE_RANGES:
+            return values
+
+        mask = self.window_mask(hours_since_start)
+        # One bulk draw decides which in-window readings spike
+        spiked = mask & (np.random.random(values.shape[0]) < self.spike_probability)
+
+        low_min, low_max, high_min, high_max = self.SPIKE_RANGES[sensor_type]
+        lows = np.random.uniform(low_min, low_max, values.shape[0])
+        highs = np.random.uniform(high_min, high_max, values.shape[0])
+        spikes = np.where(np.random.random(values.shape[0]) < 0.5, lows, highs)
+
+        return np.where(spiked, spikes, values)
+
+    def modify_batch(self, sensor_type: str,
+                     values: np.ndarray) -> np.ndarray:
+        if self.affected_sensor != 'all' and sensor_type != self.affected_sensor:
+            return values
+        if sensor_type not in self.SPIKE_RANGES:
+            return values
+
+        # Three bulk draws cover every plot in the cycle
+        n = values.shape[0]
+        spiked = np.random.random(n) < self.spike_probability
+        low_min, low_max, high_min, high_max = self.SPIKE_RANGES[sensor_type]
+        lows = np.random.uniform(low_min, low_max, n)
+        highs = np.random.uniform(high_min, high_max, n)
+        spikes = np.where(np.random.random(n) < 0.5, lows, highs)
+
+        return np.where(spiked, spikes, values)
+
 
 class DriftScenario(AnomalyScenario):
     """
@@ -177,7 +295,9 @@ class DriftScenario(AnomalyScenario):
     Effect: Sensor readings gradually shift from true values
     FAST VERSION: Drifts quickly within 15 minutes!
     """
-    
+
+    __slots__ = ('drift_amount', 'drift_direction', 'affected_sensor')
+
     def __init__(self, start_hour: float = 0.0, duration_minutes: float = 15,
                  drift_amount: float = 20.0, drift_direction: str = 'up',
                  affected_sensor: str = 'temperature'):
@@ -217,13 +337,43 @@ class DriftScenario(AnomalyScenario):
         
         if self.drift_direction == 'down':
             drift = -drift
-        
+
         return normal_value + drift
 
+    def modify_series(self, sensor_type: str, values: np.ndarray,
+                      hours_since_start: np.ndarray) -> np.ndarray:
+        if sensor_type != self.affected_sensor:
+            return values
+
+        mask = self.window_mask(hours_since_start)
+        progress = self.window_progress(hours_since_start)
+
+        # Same accelerated (quadratic-ish) drift, whole series at once
+        drift = self.drift_amount * (progress ** 1.5)
+        if self.drift_direction == 'down':
+            drift = -drift
+
+        return np.where(mask, values + drift, values)
+
+    def modify_batch(self, sensor_type: str,
+                     values: np.ndarray) -> np.ndarray:
+        if sensor_type != self.affected_sensor:
+            return values
+
+        elapsed_minutes = (datetime.now() - self.start_time).total_seconds() / 60
+        progress = min(1.0, elapsed_minutes / self.duration_minutes)
+        drift = self.drift_amount * (progress ** 1.5)
+        if self.drift_direction == 'down':
+            drift = -drift
+
+        return values + drift
+
 
 class AnomalyManager:
     """Manages multiple anomaly scenarios."""
-    
+
+    __slots__ = ('scenarios', 'simulation_start')
+
     def __init__(self):
         self.scenarios: List[AnomalyScenario] = []
         self.simulation_start = datetime.now()
@@ -270,7 +420,51 @@ class AnomalyManager:
                 modified_value = scenario.modify_reading(sensor_type, modified_value)
         
         return modified_value
-    
+
+    def modify_batch(self, sensor_type: str,
+                     values: np.ndarray) -> np.ndarray:
+        """
+        Apply all active anomalies to a cycle's values for every plot at
+        once. One vector op per scenario replaces a modify_reading call
+        per plot.
+
+        Args:
+            sensor_type: Type of sensor
+            values: Normal sensor values, one per plot
+
+        Returns:
+            Modified value array with anomalies applied
+        """
+        modified = values
+        for scenario in self.scenarios:
+            if scenario.is_active:
+                modified = scenario.modify_batch(sensor_type, modified)
+        return modified
+
+    def modify_series(self, sensor_type: str, values: np.ndarray,
+                      hours_since_start: np.ndarray) -> np.ndarray:
+        """
+        Apply every scenario to a whole value series in one pass each.
+
+        Scenario windows come from the hours axis (not wall-clock
+        activation), so this works for historical generation where the
+        entire run is produced up front.
+
+        Args:
+            sensor_type: Type of sensor
+            values: Normal sensor values for the run
+            hours_since_start: Simulated hours since run start, per value
+
+        Returns:
+            Modified value array with anomalies applied
+        """
+        modified = values
+        for scenario in self.scenarios:
+            modified = scenario.modify_series(
+                sensor_type, modified, hours_since_start
+            )
+        return modified
+
     def get_active_scenarios(self) -> List[str]:
         """Get list of currently active scenario names."""
         return [s.name for s in self.scenarios if s.is_active]
@@ -5,9 +5,17 @@ Usage: python sensor_simulator_enhanced.py --scenario [test_name]
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+import socket
+import struct
+import sys
 import time
 import numpy as np
 from datetime import datetime
+from urllib.parse import urlparse
 import argparse
 from typing import Dict, List
 import math
@@ -21,6 +29,91 @@ from anomaly_scenarios import (
     create_quick_test
 )
 
+# Optional JIT for the per-reading math; the plain Python paths remain
+# the fallback when numba isn't installed
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Optional httpx client: HTTP/2 multiplexes the per-plot POSTs over one
+# TCP+TLS connection with less per-call wrapping than requests; the
+# pooled requests.Session stays as the fallback
+try:
+    import httpx
+    HAS_HTTPX = True
+    _HTTP_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+except ImportError:
+    HAS_HTTPX = False
+    _HTTP_ERRORS = (requests.exceptions.RequestException,)
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True, fastmath=True)
+    def _gen_temp(cos_phase, mean, amplitude, noise_std):
+        """Diurnal temperature value as pure float math."""
+        return mean + amplitude * cos_phase + np.random.normal(0.0, noise_std)
+
+    @njit(cache=True, fastmath=True)
+    def _gen_humidity(temperature, cos_phase, mean, amplitude,
+                      temp_correlation, noise_std, temp_mean):
+        """Inverse diurnal humidity, correlated with temperature."""
+        humidity = mean - amplitude * cos_phase
+        humidity += temp_correlation * (temperature - temp_mean)
+        humidity += np.random.normal(0.0, noise_std)
+        return max(20.0, min(95.0, humidity))
+
+    @njit(cache=True, fastmath=True)
+    def _gen_moisture_step(current, hours_since_irrigation,
+                           irrigation_interval, boost, decay, noise):
+        """One moisture walk step; returns (new level, irrigated flag)."""
+        irrigated = hours_since_irrigation >= irrigation_interval
+        if irrigated:
+            current += boost
+        current -= decay
+        current += noise
+        return max(30.0, min(80.0, current)), irrigated
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _compute_cycle(cos_phase, noise, moisture, last_irrigation,
+                       now_ts, intervals, t_mean, t_amp,
+                       h_mean, h_amp, h_corr, boost, decay):
+        """
+        Fused numeric core of one cycle: temperature, humidity and the
+        moisture walk for every plot in a single compiled loop over the
+        state arrays. Updates moisture and last_irrigation in place and
+        returns (temps, hums, irrigated flags).
+        """
+        n = moisture.shape[0]
+        temps = np.empty(n)
+        hums = np.empty(n)
+        irrigated = np.zeros(n, dtype=np.bool_)
+        for i in range(n):
+            t = t_mean + t_amp * cos_phase + noise[i, 0]
+            h = (h_mean - h_amp * cos_phase
+                 + h_corr * (t - t_mean) + noise[i, 1])
+            if h < 20.0:
+                h = 20.0
+            elif h > 95.0:
+                h = 95.0
+            temps[i] = t
+            hums[i] = h
+
+            m = moisture[i]
+            if (now_ts - last_irrigation[i]) / 3600.0 >= intervals[i]:
+                m += boost
+                last_irrigation[i] = now_ts
+                irrigated[i] = True
+            m = m - decay + noise[i, 2]
+            if m < 30.0:
+                m = 30.0
+            elif m > 80.0:
+                m = 80.0
+            moisture[i] = m
+        return temps, hums, irrigated
+
 
 class SensorSimulator:
     """
@@ -28,119 +121,332 @@ class SensorSimulator:
     Extends baseline simulation with configurable anomaly scenarios.
     """
     
-    def __init__(self, api_url: str, plot_ids: List[int], 
-                 interval: int = 300, anomaly_manager: AnomalyManager = None):
+    # Wire format for --transport udp: one datagram per plot per cycle,
+    # unpacked by the udp_ingest management command on the server
+    _UDP_STRUCT = struct.Struct('<ifffQ')
+
+    # Fixed attribute layout: skips the per-instance __dict__ and makes
+    # attribute access a tad cheaper in the hot per-cycle paths
+    __slots__ = (
+        'api_url', 'plot_ids', 'interval', 'start_time', 'anomaly_manager',
+        'auth_token', 'session', '_sock', '_udp_addr', 'http', 'pool',
+        'config', 'baseline_params',
+        '_temp_consts', '_hum_consts', '_moi_consts',
+        '_phase_coeff', '_decay_per_cycle', '_cos_t',
+        'rng', '_noise_std', '_noise_plan', '_irr_plan',
+        '_plot_index', '_moisture', '_last_irrigation',
+        'verbosity', '_log', '_cycles', '_ok_count', '_fail_count',
+        '_endpoint',
+    )
+
+    def __init__(self, api_url: str, plot_ids: List[int],
+                 interval: int = 300, anomaly_manager: AnomalyManager = None,
+                 transport: str = 'http', udp_port: int = 9999,
+                 verbosity: int = 2):
         """
         Initialize the enhanced sensor simulator.
-        
+
         Args:
             api_url: Base URL of the Django API
             plot_ids: List of plot IDs to simulate
             interval: Time interval between readings in seconds
             anomaly_manager: Optional AnomalyManager for injecting anomalies
+            transport: 'http' (default) or 'udp' binary datagrams
+            udp_port: Port of the udp_ingest listener for --transport udp
+            verbosity: 2 = full per-reading report (default), 1 = one
+                summary line per cycle, 0 = silent with periodic stats
+                appended to sim.log
         """
         self.api_url = api_url
         self.plot_ids = plot_ids
         self.interval = interval
         self.start_time = datetime.now()
+
+        # Level 0 keeps the hot loop free of stdout syscalls: stats
+        # go to a block-buffered file every 100 cycles instead
+        self.verbosity = verbosity
+        self._log = None if verbosity else open('sim.log', 'w',
+                                                buffering=1 << 20)
+        self._cycles = 0
+        self._ok_count = 0
+        self._fail_count = 0
         
         # Anomaly management
         self.anomaly_manager = anomaly_manager
         
         # Authentication token
         self.auth_token = None
-        
+
+        # One session for the whole run: keep-alive reuses the TCP
+        # connection across cycles instead of a handshake per POST,
+        # with pooling and retries on transient 5xx
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
+
+        # Endpoint URL is invariant for the run - bind it once instead
+        # of an f-string per POST
+        self._endpoint = f'{api_url}/sensor-readings/'
+
+        # Optional UDP transport: readings leave as one packed binary
+        # datagram per plot - no TLS/HTTP framing, microseconds per send
+        self._sock = None
+        self._udp_addr = None
+        if transport == 'udp':
+            host = urlparse(api_url).hostname or 'localhost'
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._udp_addr = (host, udp_port)
+
+        # HTTP/2 client when httpx is installed: the per-plot POSTs
+        # share one multiplexed connection instead of one socket each
+        self.http = None
+        if HAS_HTTPX:
+            try:
+                self.http = httpx.Client(
+                    http2=True,
+                    base_url=api_url,
+                    headers={'Content-Type': 'application/json'},
+                    timeout=10
+                )
+            except ImportError:
+                # httpx present but the h2 extra isn't - plain HTTP/1.1
+                self.http = httpx.Client(
+                    base_url=api_url,
+                    headers={'Content-Type': 'application/json'},
+                    timeout=10
+                )
+
+        # Per-plot batches POST concurrently, so cycle wall time stays
+        # ~one RTT as the plot count grows instead of summing round-trips
+        self.pool = ThreadPoolExecutor(
+            max_workers=min(16, max(1, len(plot_ids)))
+        )
+
         # Load configuration
         self.config = SimulatorConfig
         self.baseline_params = self.config.BASELINE_PARAMS
-        
-        # Track last irrigation time for each plot
-        self.last_irrigation = {plot_id: self.start_time for plot_id in plot_ids}
-        
-        # Track moisture state for each plot
-        self.moisture_state = {
-            plot_id: self.baseline_params['moisture']['mean'] 
-            for plot_id in plot_ids
-        }
+
+        # Hot-path constants unpacked once to plain float tuples, so the
+        # per-reading generators skip the dict lookups and can hand the
+        # values straight to the jitted kernels
+        tp = self.baseline_params['temperature']
+        hp = self.baseline_params['humidity']
+        mp = self.baseline_params['moisture']
+        self._temp_consts = (
+            tp['mean'], tp['amplitude'], tp['peak_hour'], tp['noise_std']
+        )
+        self._hum_consts = (
+            hp['mean'], hp['amplitude'], hp['temp_correlation'],
+            hp['noise_std'], tp['mean'], tp['peak_hour']
+        )
+        self._moi_consts = (
+            mp['irrigation_boost'], mp['decay_rate'], mp['noise_std']
+        )
+
+        # Derived constants: the phase coefficient and the per-cycle
+        # decay are fixed for the run, so the hot paths skip the
+        # division and multiply each call
+        self._phase_coeff = 2 * math.pi / 24
+        self._decay_per_cycle = mp['decay_rate'] * (interval / 3600)
+
+        # 1440-entry diurnal cosine table keyed by minute of day: one
+        # vectorized cos pass at startup replaces every per-call
+        # math.cos (temperature and humidity share the same phase)
+        mins = np.arange(1440) / 60.0
+        self._cos_t = np.cos((mins - tp['peak_hour']) * self._phase_coeff)
+
+        # One Generator and per-sensor std row for the batched cycle
+        # draw: a single standard_normal((n_plots, 3)) call replaces six
+        # RNG entries per plot per cycle
+        self.rng = np.random.default_rng()
+        self._noise_std = np.array(
+            [tp['noise_std'], hp['noise_std'], mp['noise_std']]
+        )
+
+        # Whole-run random plans, filled by run() when --duration makes
+        # the cycle count known up front (None = draw per cycle)
+        self._noise_plan = None
+        self._irr_plan = None
+
+        # Per-plot state as parallel arrays indexed by plot position
+        # (struct-of-arrays): enables the batched cycle math and drops
+        # the dict lookups from the hot path
+        self._plot_index = {pid: i for i, pid in enumerate(plot_ids)}
+        self._moisture = np.full(
+            len(plot_ids), mp['mean'], dtype=np.float64
+        )
+        # Last irrigation as epoch seconds, so "hours since" is one
+        # vectorized subtraction instead of datetime arithmetic per plot
+        self._last_irrigation = np.full(
+            len(plot_ids), self.start_time.timestamp(), dtype=np.float64
+        )
     
     def set_auth_token(self, token: str):
         """Set the JWT authentication token."""
         self.auth_token = token
-    
-    def get_time_of_day(self) -> float:
-        """Get current time of day as hours since midnight (0-24)."""
-        current_time = datetime.now()
+        self.session.headers.update({'Authorization': f'Bearer {token}'})
+        if self.http is not None:
+            self.http.headers.update({'Authorization': f'Bearer {token}'})
+
+    def get_time_of_day(self, now: datetime = None) -> float:
+        """Get time of day as hours since midnight (0-24)."""
+        current_time = now or datetime.now()
         return current_time.hour + current_time.minute / 60.0
-    
-    def get_hours_since_start(self) -> float:
+
+    def get_hours_since_start(self, now: datetime = None) -> float:
         """Get hours since simulation start."""
-        return (datetime.now() - self.start_time).total_seconds() / 3600
+        return ((now or datetime.now()) - self.start_time).total_seconds() / 3600
     
+    def _cos_phase(self, time_of_day: float) -> float:
+        """Diurnal cosine from the minute-of-day lookup table."""
+        return float(self._cos_t[int(time_of_day * 60) % 1440])
+
     def generate_temperature(self, time_of_day: float) -> float:
-        params = self.baseline_params['temperature']
-        
-        phase = (time_of_day - params['peak_hour']) * (2 * math.pi / 24)
-        temperature = params['mean'] + params['amplitude'] * math.cos(phase)
-        
-        temperature += np.random.normal(0, params['noise_std'])
-        
-        return round(temperature, 2)
-    
+        mean, amplitude, _peak_hour, noise_std = self._temp_consts
+        cos_phase = self._cos_phase(time_of_day)
+
+        if HAS_NUMBA:
+            return _gen_temp(cos_phase, mean, amplitude, noise_std)
+
+        temperature = mean + amplitude * cos_phase
+        temperature += np.random.normal(0, noise_std)
+
+        # Raw float: JSON carries full precision, the print path formats
+        return temperature
+
     def generate_humidity(self, temperature: float, time_of_day: float) -> float:
-        params = self.baseline_params['humidity']
-        temp_params = self.baseline_params['temperature']
-        
-        phase = (time_of_day - temp_params['peak_hour']) * (2 * math.pi / 24)
-        humidity = params['mean'] - params['amplitude'] * math.cos(phase)
-        
-        temp_deviation = temperature - temp_params['mean']
-        humidity += params['temp_correlation'] * temp_deviation
-        
-        humidity += np.random.normal(0, params['noise_std'])
-        
+        mean, amplitude, temp_correlation, noise_std, temp_mean, _temp_peak = (
+            self._hum_consts
+        )
+        cos_phase = self._cos_phase(time_of_day)
+
+        if HAS_NUMBA:
+            return _gen_humidity(temperature, cos_phase, mean, amplitude,
+                                 temp_correlation, noise_std, temp_mean)
+
+        humidity = mean - amplitude * cos_phase
+
+        temp_deviation = temperature - temp_mean
+        humidity += temp_correlation * temp_deviation
+
+        humidity += np.random.normal(0, noise_std)
+
         humidity = max(20.0, min(95.0, humidity))  # ← This line already exists
-        
-        return round(humidity, 2)
+
+        return humidity
     
-    def generate_moisture(self, plot_id: int) -> float:
-        """Generate realistic soil moisture reading with irrigation cycles."""
-        params = self.baseline_params['moisture']
-        
+    def generate_moisture(self, plot_id: int, noise: float = None) -> float:
+        """
+        Generate realistic soil moisture reading with irrigation cycles.
+        `noise` is taken from the cycle's batched draw when provided,
+        otherwise drawn here (standalone use).
+        """
+        irrigation_boost, decay_rate, noise_std = self._moi_consts
+
+        if noise is None:
+            noise = self.rng.standard_normal() * noise_std
+
         # Get current moisture state
-        current_moisture = self.moisture_state[plot_id]
-        
+        idx = self._plot_index[plot_id]
+        current_moisture = self._moisture[idx]
+
         # Check if irrigation should occur
         hours_since_irrigation = (
-            datetime.now() - self.last_irrigation[plot_id]
-        ).total_seconds() / 3600
-        
+            datetime.now().timestamp() - self._last_irrigation[idx]
+        ) / 3600
+
         # Irrigation interval: 18 ± 4 hours
         irrigation_interval = (
-            self.config.IRRIGATION_INTERVAL_HOURS + 
-            np.random.uniform(
+            self.config.IRRIGATION_INTERVAL_HOURS +
+            self.rng.uniform(
                 -self.config.IRRIGATION_VARIANCE_HOURS,
                 self.config.IRRIGATION_VARIANCE_HOURS
             )
         )
-        
-        if hours_since_irrigation >= irrigation_interval:
-            # Irrigation event - increase moisture
-            current_moisture += params['irrigation_boost']
-            self.last_irrigation[plot_id] = datetime.now()
-            print(f"💧 [IRRIGATION] Plot {plot_id} irrigated at {datetime.now().strftime('%H:%M:%S')}")
-        
+
         # Gradual decrease during day
-        decay = params['decay_rate'] * (self.interval / 3600)
-        current_moisture -= decay
-        
-        # Add random noise
-        current_moisture += np.random.normal(0, params['noise_std'])
-    
-        current_moisture = max(30.0, min(80.0, current_moisture))  # ← This line exists
-        
-        self.moisture_state[plot_id] = current_moisture
-        
-        return round(current_moisture, 2)
+        decay = self._decay_per_cycle
+
+        if HAS_NUMBA:
+            current_moisture, irrigated = _gen_moisture_step(
+                current_moisture, hours_since_irrigation,
+                irrigation_interval, irrigation_boost, decay, noise
+            )
+        else:
+            irrigated = hours_since_irrigation >= irrigation_interval
+            if irrigated:
+                # Irrigation event - increase moisture
+                current_moisture += irrigation_boost
+
+            current_moisture -= decay
+
+            # Add random noise
+            current_moisture += noise
+
+            current_moisture = max(30.0, min(80.0, current_moisture))  # ← This line exists
+
+        if irrigated:
+            self._last_irrigation[idx] = datetime.now().timestamp()
+            if self.verbosity >= 2:
+                print(f"💧 [IRRIGATION] Plot {plot_id} irrigated at {datetime.now().strftime('%H:%M:%S')}")
+
+        self._moisture[idx] = current_moisture
+
+        return current_moisture
+
+    def _generate_moisture_batch(self, noise: np.ndarray,
+                                 irr_var: np.ndarray = None,
+                                 now: datetime = None) -> np.ndarray:
+        """
+        Advance every plot's moisture walk in one array pass: irrigation
+        checks, boost, decay, noise and clamping are vectorized over the
+        state arrays instead of looping per plot.
+
+        Args:
+            noise: Per-plot moisture noise column from the cycle draw
+            irr_var: Pre-sampled per-plot irrigation jitter, or None to
+                draw it here
+
+        Returns:
+            Per-plot moisture values rounded to 2 decimals
+        """
+        irrigation_boost, decay_rate, _ = self._moi_consts
+
+        now = now or datetime.now()
+        now_ts = now.timestamp()
+        hours_since = (now_ts - self._last_irrigation) / 3600.0
+        if irr_var is None:
+            irr_var = self.rng.uniform(
+                -self.config.IRRIGATION_VARIANCE_HOURS,
+                self.config.IRRIGATION_VARIANCE_HOURS,
+                size=self._moisture.shape[0]
+            )
+        intervals = self.config.IRRIGATION_INTERVAL_HOURS + irr_var
+
+        irrigated = hours_since >= intervals
+        if irrigated.any():
+            self._moisture = np.where(
+                irrigated, self._moisture + irrigation_boost, self._moisture
+            )
+            self._last_irrigation[irrigated] = now_ts
+            if self.verbosity >= 2:
+                stamp = now.strftime('%H:%M:%S')
+                for pos in np.flatnonzero(irrigated):
+                    print(f"💧 [IRRIGATION] Plot {self.plot_ids[pos]} "
+                          f"irrigated at {stamp}")
+
+        decay = self._decay_per_cycle
+        self._moisture = np.clip(
+            self._moisture - decay + noise, 30.0, 80.0
+        )
+
+        return self._moisture
     
     def apply_anomalies(self, sensor_type: str, normal_value: float) -> float:
         """
@@ -156,18 +462,32 @@ class SensorSimulator:
         if self.anomaly_manager:
             return self.anomaly_manager.modify_reading(sensor_type, normal_value)
         return normal_value
-    
-    def create_sensor_reading(self, plot_id: int, sensor_type: str, 
-                             value: float, is_anomalous: bool = False) -> Dict:
+
+    def apply_anomalies_batch(self, sensor_type: str,
+                              values: np.ndarray) -> np.ndarray:
+        """
+        Apply anomaly modifications to a whole cycle's values at once,
+        one array per sensor covering every plot. Replaces a
+        modify_reading call per plot with one vector op per scenario.
+        """
+        if self.anomaly_manager:
+            return self.anomaly_manager.modify_batch(sensor_type, values)
+        return values
+
+    def create_sensor_reading(self, plot_id: int, sensor_type: str,
+                             value: float, is_anomalous: bool = False,
+                             timestamp_iso: str = None) -> Dict:
         """
         Create a sensor reading payload for the API.
-        
+
         Args:
             plot_id: Plot identifier
             sensor_type: Type of sensor
             value: Sensor value
             is_anomalous: Whether this reading has been modified by anomaly
-            
+            timestamp_iso: Pre-formatted ISO timestamp shared by the
+                cycle, formatted here if not given
+
         Returns:
             Dictionary payload for API
         """
@@ -175,98 +495,255 @@ class SensorSimulator:
             'plot': plot_id,
             'sensor_type': sensor_type,
             'value': value,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp_iso or datetime.now().isoformat(),
             'source': 'simulator_anomaly' if is_anomalous else 'simulator'
         }
     
-    def send_reading(self, reading: Dict) -> bool:
-        """Send a sensor reading to the Django API."""
-        headers = {'Content-Type': 'application/json'}
-        
-        if self.auth_token:
-            headers['Authorization'] = f'Bearer {self.auth_token}'
-        
+    def _send_udp_plot(self, plot_id: int, temperature: float,
+                       humidity: float, moisture: float) -> bool:
+        """Fire one packed datagram carrying a plot's cycle readings."""
+        buf = self._UDP_STRUCT.pack(
+            plot_id, temperature, humidity, moisture, time.time_ns()
+        )
         try:
-            response = requests.post(
-                f'{self.api_url}/sensor-readings/',
-                json=reading,
-                headers=headers,
-                timeout=10
-            )
-            
+            self._sock.sendto(buf, self._udp_addr)
+            return True
+        except OSError as e:
+            print(f"❌ UDP send error: {e}")
+            return False
+
+    def send_readings(self, readings: List[Dict]) -> bool:
+        """
+        Send a batch of sensor readings to the Django API in one POST.
+        The list-create endpoint accepts list payloads, so a whole
+        cycle costs one round-trip instead of 3 x len(plot_ids).
+        Content-Type and Authorization live on the session headers, set
+        once instead of rebuilt per request.
+        """
+        try:
+            # orjson encodes in native code (~2-5x the stdlib encoder
+            # both clients would use for json=) and hands over bytes
+            body = orjson.dumps(readings)
+            if self.http is not None:
+                response = self.http.post('/sensor-readings/', content=body)
+            else:
+                response = self.session.post(
+                    self._endpoint,
+                    data=body,
+                    timeout=10
+                )
+
             if response.status_code in [200, 201]:
                 return True
             else:
-                print(f"❌ Error sending reading: {response.status_code} - {response.text}")
+                print(f"❌ Error sending batch: {response.status_code} - {response.text}")
                 return False
-                
-        except requests.exceptions.RequestException as e:
+
+        except _HTTP_ERRORS as e:
             print(f"❌ Connection error: {e}")
             return False
     
-    def simulate_cycle(self):
-        """Run one simulation cycle with anomaly injection."""
-        time_of_day = self.get_time_of_day()
-        hours_since_start = self.get_hours_since_start()
+    def simulate_cycle(self, cycle_idx: int = None):
+        """
+        Run one simulation cycle with anomaly injection.
+        `cycle_idx` selects this cycle's row from the pre-sampled random
+        plans when run() allocated them.
+        """
+        # One clock read and one ISO formatting for the whole cycle
+        # instead of ~(1 + 3 x n_plots) datetime.now() calls
+        now = datetime.now()
+        now_iso = now.isoformat()
+        time_of_day = self.get_time_of_day(now)
+        hours_since_start = self.get_hours_since_start(now)
         
         # Update anomaly manager
         if self.anomaly_manager:
             self.anomaly_manager.update()
         
-        # Display cycle header
-        print(f"\n{'='*70}")
-        print(f"⏰ [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Simulation Cycle")
-        print(f"   Time of day: {time_of_day:.2f}h | Hours since start: {hours_since_start:.2f}h")
-        
-        # Display active anomalies
-        if self.anomaly_manager and self.anomaly_manager.has_active_anomalies():
-            active = self.anomaly_manager.get_active_scenarios()
-            print(f"   🚨 ACTIVE ANOMALIES: {', '.join(active)}")
-        
-        print(f"{'='*70}")
+        # Display cycle header (skipped in quiet mode: synchronous
+        # stdout writes in a tight loop cost more than the math)
+        if self.verbosity >= 2:
+            print(f"\n{'='*70}")
+            print(f"⏰ [{now.strftime('%Y-%m-%d %H:%M:%S')}] Simulation Cycle")
+            print(f"   Time of day: {time_of_day:.2f}h | Hours since start: {hours_since_start:.2f}h")
+
+            # Display active anomalies
+            if self.anomaly_manager and self.anomaly_manager.has_active_anomalies():
+                active = self.anomaly_manager.get_active_scenarios()
+                print(f"   🚨 ACTIVE ANOMALIES: {', '.join(active)}")
+
+            print(f"{'='*70}")
         
-        for plot_id in self.plot_ids:
-            print(f"\n🌾 Plot {plot_id}:")
-            
-            # Generate normal values
-            normal_temperature = self.generate_temperature(time_of_day)
-            normal_humidity = self.generate_humidity(normal_temperature, time_of_day)
-            normal_moisture = self.generate_moisture(plot_id)
-            
-            # Apply anomalies
-            temperature = self.apply_anomalies('temperature', normal_temperature)
-            humidity = self.apply_anomalies('humidity', normal_humidity)
-            moisture = self.apply_anomalies('moisture', normal_moisture)
-            
-            # Check if values were modified
-            temp_anomalous = abs(temperature - normal_temperature) > 0.01
-            humidity_anomalous = abs(humidity - normal_humidity) > 0.01
-            moisture_anomalous = abs(moisture - normal_moisture) > 0.01
-            
-            # Create and send readings
-            readings = [
-                (self.create_sensor_reading(plot_id, 'temperature', temperature, temp_anomalous),
+        # Generate every reading first, then ship the whole cycle in one
+        # bulk POST - the cycle is HTTP-latency-bound, not compute-bound
+        cycle_rows = []  # (plot_id, reading, is_anomalous, normal_val)
+        plot_values = []  # (plot_id, temperature, humidity, moisture)
+
+        # One batched RNG draw and one array expression per sensor for
+        # the whole cycle: temperature/humidity share the diurnal term,
+        # so only the noise column differs per plot. With a fixed
+        # duration the draws come pre-sampled for the whole run.
+        n_plots = len(self.plot_ids)
+        irr_var = None
+        if (self._noise_plan is not None and cycle_idx is not None
+                and cycle_idx < self._noise_plan.shape[0]):
+            noise = self._noise_plan[cycle_idx]
+            irr_var = self._irr_plan[cycle_idx]
+        else:
+            noise = self.rng.standard_normal((n_plots, 3)) * self._noise_std
+        t_mean, t_amp, _t_peak, _ = self._temp_consts
+        h_mean, h_amp, h_corr = self._hum_consts[:3]
+        cos_phase = self._cos_phase(time_of_day)
+
+        if HAS_NUMBA:
+            # One fused compiled loop produces all three sensors and
+            # advances the moisture state - LLVM keeps the whole cycle's
+            # math out of the interpreter
+            if irr_var is None:
+                irr_var = self.rng.uniform(
+                    -self.config.IRRIGATION_VARIANCE_HOURS,
+                    self.config.IRRIGATION_VARIANCE_HOURS,
+                    size=n_plots
+                )
+            intervals = self.config.IRRIGATION_INTERVAL_HOURS + irr_var
+            boost = self._moi_consts[0]
+            temps, hums, irrigated = _compute_cycle(
+                cos_phase, noise, self._moisture, self._last_irrigation,
+                now.timestamp(), intervals, t_mean, t_amp,
+                h_mean, h_amp, h_corr, boost, self._decay_per_cycle
+            )
+            moistures = self._moisture
+            if self.verbosity >= 2 and irrigated.any():
+                stamp = now.strftime('%H:%M:%S')
+                for pos in np.flatnonzero(irrigated):
+                    print(f"💧 [IRRIGATION] Plot {self.plot_ids[pos]} "
+                          f"irrigated at {stamp}")
+        else:
+            # No rounding in the payload path: round() allocates a new
+            # float per value and the API stores whatever precision it
+            # gets. The report formats with :.2f for display only.
+            temps = t_mean + t_amp * cos_phase + noise[:, 0]
+            hums = np.clip(
+                h_mean - h_amp * cos_phase
+                + h_corr * (temps - t_mean) + noise[:, 1],
+                20.0, 95.0
+            )
+            moistures = self._generate_moisture_batch(
+                noise[:, 2], irr_var, now
+            )
+
+        # Apply anomalies to all plots at once: three array-level calls
+        # per cycle instead of three scalar calls per plot
+        mod_temps = self.apply_anomalies_batch('temperature', temps)
+        mod_hums = self.apply_anomalies_batch('humidity', hums)
+        mod_moists = self.apply_anomalies_batch('moisture', moistures)
+        temp_flags = np.abs(mod_temps - temps) > 0.01
+        hum_flags = np.abs(mod_hums - hums) > 0.01
+        moist_flags = np.abs(mod_moists - moistures) > 0.01
+
+        for i, plot_id in enumerate(self.plot_ids):
+            # Normal values from the batched arrays
+            normal_temperature = float(temps[i])
+            normal_humidity = float(hums[i])
+            normal_moisture = float(moistures[i])
+
+            temperature = float(mod_temps[i])
+            humidity = float(mod_hums[i])
+            moisture = float(mod_moists[i])
+
+            temp_anomalous = bool(temp_flags[i])
+            humidity_anomalous = bool(hum_flags[i])
+            moisture_anomalous = bool(moist_flags[i])
+
+            plot_values.append((plot_id, temperature, humidity, moisture))
+            cycle_rows.extend([
+                (plot_id,
+                 self.create_sensor_reading(plot_id, 'temperature', temperature, temp_anomalous, now_iso),
                  temp_anomalous, normal_temperature),
-                (self.create_sensor_reading(plot_id, 'humidity', humidity, humidity_anomalous),
+                (plot_id,
+                 self.create_sensor_reading(plot_id, 'humidity', humidity, humidity_anomalous, now_iso),
                  humidity_anomalous, normal_humidity),
-                (self.create_sensor_reading(plot_id, 'moisture', moisture, moisture_anomalous),
+                (plot_id,
+                 self.create_sensor_reading(plot_id, 'moisture', moisture, moisture_anomalous, now_iso),
                  moisture_anomalous, normal_moisture)
+            ])
+
+        # UDP transport: one fire-and-forget datagram per plot, packed
+        # binary instead of HTTP framing
+        if self._sock is not None:
+            futures = [
+                self.pool.submit(self._send_udp_plot, *values)
+                for values in plot_values
             ]
-            
-            for reading, is_anomalous, normal_val in readings:
-                success = self.send_reading(reading)
-                status = "✅" if success else "❌"
-                anomaly_marker = " 🚨 ANOMALY" if is_anomalous else ""
-                
-                # Format value with appropriate unit
-                unit = "°C" if reading['sensor_type'] == 'temperature' else "%"
-                
-                print(f"   {status} {reading['sensor_type']:12s}: {reading['value']:6.2f}{unit}{anomaly_marker}")
-                
-                # Show deviation if anomalous
-                if is_anomalous:
-                    deviation = reading['value'] - normal_val
-                    print(f"      └─ Normal: {normal_val:6.2f}{unit}, Deviation: {deviation:+6.2f}{unit}")
+            return cycle_rows, futures
+
+        # One bulk POST per plot, all fired without waiting: the futures
+        # drain on the pool threads while run() sleeps out the interval,
+        # so network tail latency overlaps the idle time between cycles
+        plot_batches = [
+            [row[1] for row in cycle_rows if row[0] == plot_id]
+            for plot_id in self.plot_ids
+        ]
+        futures = [
+            self.pool.submit(self.send_readings, batch)
+            for batch in plot_batches
+        ]
+        return cycle_rows, futures
+
+    def report_cycle(self, cycle_rows, futures):
+        """
+        Print per-reading status once the cycle's POSTs finish.
+        Called by run() after the inter-cycle sleep, by which point the
+        futures have normally already resolved in the background.
+        """
+        results = [future.result() for future in futures]
+        self._cycles += 1
+        self._ok_count += sum(1 for ok in results if ok)
+        self._fail_count += sum(1 for ok in results if not ok)
+
+        if self.verbosity == 0:
+            # Stats line every 100 cycles into the block-buffered log -
+            # no stdout syscalls in the hot loop
+            if self._log is not None and self._cycles % 100 == 0:
+                self._log.write(
+                    'cycle={} ok={} fail={}\n'.format(
+                        self._cycles, self._ok_count, self._fail_count
+                    )
+                )
+            return
+
+        if self.verbosity == 1:
+            # One line per cycle, no per-reading formatting at all
+            sys.stdout.write('cycle %d: %d/%d batches ok\n' % (
+                self._cycles, sum(1 for ok in results if ok), len(results)
+            ))
+            return
+
+        success_by_plot = dict(zip(self.plot_ids, results))
+
+        # Build the whole report in memory and write it with one
+        # syscall instead of one per print
+        lines = []
+        current_plot = None
+        for plot_id, reading, is_anomalous, normal_val in cycle_rows:
+            if plot_id != current_plot:
+                lines.append(f"\n🌾 Plot {plot_id}:\n")
+                current_plot = plot_id
+
+            status = "✅" if success_by_plot[plot_id] else "❌"
+            anomaly_marker = " 🚨 ANOMALY" if is_anomalous else ""
+
+            # Format value with appropriate unit
+            unit = "°C" if reading['sensor_type'] == 'temperature' else "%"
+
+            lines.append(f"   {status} {reading['sensor_type']:12s}: {reading['value']:6.2f}{unit}{anomaly_marker}\n")
+
+            # Show deviation if anomalous
+            if is_anomalous:
+                deviation = reading['value'] - normal_val
+                lines.append(f"      └─ Normal: {normal_val:6.2f}{unit}, Deviation: {deviation:+6.2f}{unit}\n")
+
+        sys.stdout.write(''.join(lines))
     
     def run(self, duration_hours: float = None):
         """Run the simulator continuously or for a specified duration."""
@@ -293,28 +770,63 @@ class SensorSimulator:
         
         print("="*70)
         
-        start_time = time.time()
+        # With a fixed duration the cycle count is known, so the whole
+        # run's randomness is drawn in two bulk RNG fills and cycles
+        # just slice rows from contiguous memory
+        if duration_hours:
+            cycles = int(duration_hours * 3600 / self.interval) + 1
+            n_plots = len(self.plot_ids)
+            self._noise_plan = (
+                self.rng.standard_normal((cycles, n_plots, 3))
+                * self._noise_std
+            )
+            self._irr_plan = self.rng.uniform(
+                -self.config.IRRIGATION_VARIANCE_HOURS,
+                self.config.IRRIGATION_VARIANCE_HOURS,
+                size=(cycles, n_plots)
+            )
+
+        # Integer deadline on the monotonic clock: the per-cycle check
+        # is one int comparison, immune to wall-clock adjustments
+        deadline_ns = None
+        if duration_hours:
+            deadline_ns = (time.monotonic_ns()
+                           + int(duration_hours * 3600 * 1e9))
         cycle_count = 0
-        
+
         try:
             while True:
                 cycle_count += 1
-                self.simulate_cycle()
-                
+                pending = self.simulate_cycle(cycle_idx=cycle_count - 1)
+
                 # Check duration
-                if duration_hours:
-                    elapsed_hours = (time.time() - start_time) / 3600
-                    if elapsed_hours >= duration_hours:
+                if deadline_ns is not None:
+                    if time.monotonic_ns() >= deadline_ns:
+                        self.report_cycle(*pending)
                         print(f"\n✅ Simulation completed: {duration_hours} hours ({cycle_count} cycles)")
                         break
-                
-                # Wait for next cycle
-                print(f"\n⏳ Waiting {self.interval} seconds until next cycle...")
+
+                # Sleep first, report after: the cycle's POSTs drain on
+                # the pool threads during the wait instead of blocking
+                # before it, so network tail latency costs nothing
+                if self.verbosity >= 2:
+                    print(f"\n⏳ Waiting {self.interval} seconds until next cycle...")
                 time.sleep(self.interval)
-                
+                self.report_cycle(*pending)
+
         except KeyboardInterrupt:
             print(f"\n\n⚠️ Simulation stopped by user after {cycle_count} cycles")
             print("="*70)
+        finally:
+            if self._log is not None:
+                self._log.write(
+                    'final cycle={} ok={} fail={}\n'.format(
+                        self._cycles, self._ok_count, self._fail_count
+                    )
+                )
+                self._log.close()
+                print(f"\n📊 {self._ok_count} batches sent, "
+                      f"{self._fail_count} failed (stats in sim.log)")
 
 
 def main():
@@ -353,10 +865,37 @@ def main():
         default=None,
         help='JWT authentication token'
     )
+    parser.add_argument(
+        '--transport',
+        type=str,
+        choices=['http', 'udp'],
+        default='http',
+        help='Reading transport: http POSTs (default) or binary UDP '
+             'datagrams (pair with manage.py udp_ingest)'
+    )
+    parser.add_argument(
+        '--udp-port',
+        type=int,
+        default=9999,
+        help='udp_ingest listener port for --transport udp (default: 9999)'
+    )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Shorthand for --verbosity 0'
+    )
+    parser.add_argument(
+        '--verbosity',
+        type=int,
+        choices=[0, 1, 2],
+        default=2,
+        help='0 = silent (stats to sim.log), 1 = one summary line per '
+             'cycle, 2 = full per-reading report (default)'
+    )
     parser.add_argument(
         '--scenario',
         type=str,
-        choices=['baseline', 'irrigation_failure', 'sensor_malfunction', 
+        choices=['baseline', 'irrigation_failure', 'sensor_malfunction',
                 'calibration_drift', 'full_suite', 'quick_test'],
         default='baseline',
         help='Test scenario to run (default: baseline - no anomalies)'
@@ -395,7 +934,10 @@ def main():
         api_url=args.api_url,
         plot_ids=args.plots,
         interval=args.interval,
-        anomaly_manager=anomaly_manager
+        anomaly_manager=anomaly_manager,
+        transport=args.transport,
+        udp_port=args.udp_port,
+        verbosity=0 if args.quiet else args.verbosity
     )
     
     if args.token: